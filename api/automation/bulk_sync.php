@@ -29,11 +29,8 @@ use MokoEnterprise\{
     CLIApp,
     Config,
     MetricsCollector,
-    PluginFactory,
-    ProjectTypeDetector,
     RateLimitExceeded,
     RepositorySynchronizer,
-    SecurityValidator,
     SynchronizationNotImplementedException
 };
 
@@ -61,9 +58,6 @@ class BulkSync extends CLIApp
     private RepositorySynchronizer $synchronizer;
     private AuditLogger $logger;
     private CheckpointManager $checkpoints;
-    private SecurityValidator $security;
-    private PluginFactory $pluginFactory;
-    private ProjectTypeDetector $typeDetector;
     
     /**
      * Setup command-line arguments
@@ -74,6 +68,7 @@ class BulkSync extends CLIApp
             'org:' => 'GitHub organization (default: mokoconsulting-tech)',
             'repos:' => 'Specific repositories to sync (space-separated)',
             'exclude:' => 'Repositories to exclude (space-separated)',
+            'limit:' => 'Sync at most this many repositories (in name order)',
             'skip-archived' => 'Skip archived repositories',
             'yes' => 'Auto-confirm prompts',
         ];
@@ -99,6 +94,8 @@ class BulkSync extends CLIApp
         // Get repository filters
         $specificRepos = $this->parseRepositoryList($this->getOption('repos', ''));
         $excludeRepos = $this->parseRepositoryList($this->getOption('exclude', ''));
+        $limitOption = (string) $this->getOption('limit', '');
+        $limit = $limitOption !== '' ? max(1, (int) $limitOption) : null;
         
         $this->log("Organization: {$org}", 'INFO');
         if (!empty($specificRepos)) {
@@ -107,13 +104,22 @@ class BulkSync extends CLIApp
         if (!empty($excludeRepos)) {
             $this->log("Excluding: " . implode(', ', $excludeRepos), 'INFO');
         }
+        if ($limit !== null) {
+            $this->log("Limit: {$limit} repositories", 'INFO');
+        }
         
         // Get repositories
         $this->log("📋 Fetching repositories...", 'INFO');
-        $repositories = $this->synchronizer->getRepositories($org, $skipArchived);
+        // Without include/exclude filters the listing itself can stop at the
+        // limit; with them, the limit applies to what the filters leave.
+        $fetchLimit = empty($specificRepos) && empty($excludeRepos) ? $limit : null;
+        $repositories = $this->synchronizer->getRepositories($org, $skipArchived, $fetchLimit);
         
         // Apply filters
         $repositories = $this->filterRepositories($repositories, $specificRepos, $excludeRepos);
+        if ($limit !== null) {
+            $repositories = array_slice($repositories, 0, $limit);
+        }
 
         // Always process .github-private first so universal workflows and issue
         // templates are up-to-date before any other repo is synced.
@@ -166,7 +172,6 @@ class BulkSync extends CLIApp
             $this->logger = new AuditLogger('bulk_sync');
             $this->metrics = new MetricsCollector();
             $this->checkpoints = new CheckpointManager('.checkpoints');
-            $this->security = new SecurityValidator();
             $this->synchronizer = new RepositorySynchronizer(
                 $this->api,
                 $this->logger,
@@ -174,11 +179,9 @@ class BulkSync extends CLIApp
                 $this->checkpoints
             );
             
-            // Initialize plugin system
-            $this->pluginFactory = new PluginFactory($this->logger, $this->metrics);
-            $this->typeDetector = new ProjectTypeDetector($this->logger);
-            
-            $this->log("✓ Enterprise components initialized with plugin system", 'INFO');
+            // Only what the sync path uses is constructed here, so each run
+            // does not autoload and build components it never touches.
+            $this->log("✓ Enterprise components initialized", 'INFO');
             return true;
             
         } catch (\Exception $e) {
@@ -207,11 +210,16 @@ class BulkSync extends CLIApp
      */
     private function filterRepositories(array $repositories, array $include, array $exclude): array
     {
+        // Flip the name lists into sets once so each repository is matched
+        // with a hash lookup instead of a linear scan of the list.
+        $include = array_flip($include);
+        $exclude = array_flip($exclude);
+
         // Apply include filter if specified
         if (!empty($include)) {
             $repositories = array_filter(
                 $repositories,
-                fn($repo) => in_array($repo['name'], $include)
+                fn($repo) => isset($include[$repo['name']])
             );
         }
         
@@ -219,7 +227,7 @@ class BulkSync extends CLIApp
         if (!empty($exclude)) {
             $repositories = array_filter(
                 $repositories,
-                fn($repo) => !in_array($repo['name'], $exclude)
+                fn($repo) => !isset($exclude[$repo['name']])
             );
         }
         
@@ -287,6 +295,10 @@ class BulkSync extends CLIApp
         ];
         
         $startTime = microtime(true);
+
+        // Probe every repository for an override file up front, concurrently,
+        // instead of one blocking request per repository inside the loop.
+        $this->synchronizer->prefetchOverrideFlags($org, array_column($repositories, 'name'));
         
         foreach ($repositories as $index => $repo) {
             $repoName = $repo['name'];
@@ -371,6 +383,8 @@ class BulkSync extends CLIApp
         
         $duration = microtime(true) - $startTime;
         $results['duration'] = $duration;
+        // Computed once here for both the console report and the step summary.
+        $results['success_rate'] = 100.0 * $results['success'] / max($results['total'], 1);
         
         return $results;
     }
@@ -380,36 +394,40 @@ class BulkSync extends CLIApp
      */
     private function displayResults(array $results): void
     {
-        $this->log("\n" . str_repeat('=', 60), 'INFO');
-        $this->log("📊 Synchronization Complete", 'INFO');
-        $this->log(str_repeat('=', 60), 'INFO');
-        
         $total = $results['total'];
         $success = $results['success'];
         $skipped = $results['skipped'];
         $failed = $results['failed'];
         $duration = $results['duration'];
-        
-        $successRate = $total > 0 ? round(($success / $total) * 100, 1) : 0;
-        
-        $this->log(sprintf("Total:    %d repositories", $total), 'INFO');
-        $this->log(sprintf("Success:  %d (✓)", $success), 'INFO');
-        $this->log(sprintf("Skipped:  %d (⊘)", $skipped), 'INFO');
-        $this->log(sprintf("Failed:   %d (✗)", $failed), 'INFO');
-        $this->log(sprintf("Success Rate: %.1f%%", $successRate), 'INFO');
-        $this->log(sprintf("Duration: %.2f seconds", $duration), 'INFO');
+        $successRate = $results['success_rate'];
+        
+        // Each section is assembled first and written with one call rather
+        // than one write per line.
+        $this->logLines([
+            "\n" . str_repeat('=', 60),
+            "📊 Synchronization Complete",
+            str_repeat('=', 60),
+            sprintf("Total:    %d repositories", $total),
+            sprintf("Success:  %d (✓)", $success),
+            sprintf("Skipped:  %d (⊘)", $skipped),
+            sprintf("Failed:   %d (✗)", $failed),
+            sprintf("Success Rate: %.1f%%", $successRate),
+            sprintf("Duration: %.2f seconds", $duration),
+        ], 'INFO');
         
         if ($failed > 0) {
-            $this->log("\n⚠️  Failed Repositories:", 'WARN');
+            $lines = ["\n⚠️  Failed Repositories:"];
             foreach ($results['repositories'] as $repo => $status) {
                 if ($status === 'failed') {
-                    $this->log("  - {$repo}", 'WARN');
+                    $lines[] = "  - {$repo}";
                 }
             }
+            $this->logLines($lines, 'WARN');
         }
         
+        $lines = [];
         if ($this->verbose) {
-            $this->log("\n📋 Repository Details:", 'INFO');
+            $lines[] = "\n📋 Repository Details:";
             foreach ($results['repositories'] as $repo => $status) {
                 $icon = match($status) {
                     'success' => '✓',
@@ -417,11 +435,11 @@ class BulkSync extends CLIApp
                     'failed' => '✗',
                     default => '?'
                 };
-                $this->log(sprintf("  %s %s: %s", $icon, $repo, $status), 'INFO');
+                $lines[] = sprintf("  %s %s: %s", $icon, $repo, $status);
             }
         }
-        
-        $this->log(str_repeat('=', 60), 'INFO');
+        $lines[] = str_repeat('=', 60);
+        $this->logLines($lines, 'INFO');
         
         $this->writeStepSummary($results);
     }
@@ -454,7 +472,7 @@ class BulkSync extends CLIApp
         $skipped = $results['skipped'];
         $failed = $results['failed'];
         $duration = $results['duration'];
-        $successRate = $total > 0 ? round(($success / $total) * 100, 1) : 0;
+        $successRate = $results['success_rate'];
         
         $lines = [];
         $lines[] = '';
@@ -43,6 +43,13 @@ class Common
 	const EXIT_NOT_FOUND    = 3;
 	const EXIT_PERMISSION   = 4;
 
+	/**
+	 * Repository roots already resolved by getRepoRoot(), keyed by cwd.
+	 *
+	 * @var array<string, string>
+	 */
+	private static array $repoRoots = [];
+
 	// ── Logging ───────────────────────────────────────────────────────────────
 
 	/**
@@ -168,15 +175,23 @@ class Common
 	/**
 	 * Return the absolute path to the repository root by walking up from cwd.
 	 *
+	 * The walk costs one stat per parent directory, so the result is
+	 * memoised per working directory for the rest of the process.
+	 *
 	 * @throws \RuntimeException  When no .git directory is found.
 	 * @return string  Absolute path (no trailing slash).
 	 */
 	public static function getRepoRoot(): string
 	{
-		$dir = (string) getcwd();
+		$cwd = (string) getcwd();
+		if (isset(self::$repoRoots[$cwd])) {
+			return self::$repoRoots[$cwd];
+		}
+
+		$dir = $cwd;
 		while ($dir !== '/') {
 			if (is_dir($dir . '/.git')) {
-				return $dir;
+				return self::$repoRoots[$cwd] = $dir;
 			}
 			$dir = dirname($dir);
 		}
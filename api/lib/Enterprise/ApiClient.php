@@ -7,7 +7,7 @@ declare(strict_types=1);
  *
  * This class provides enterprise-grade API client capabilities with:
  * - Automatic rate limiting with backoff
- * - Retry logic with exponential backoff
+ * - Retry logic with jittered exponential backoff
  * - Request tracking and throttling
  * - Response caching
  * - Circuit breaker pattern
@@ -25,14 +25,16 @@ declare(strict_types=1);
 
 namespace MokoEnterprise;
 
-use DateTime;
-use DateTimeZone;
 use GuzzleHttp\Client;
 use GuzzleHttp\Exception\GuzzleException;
 use GuzzleHttp\Exception\RequestException;
+use GuzzleHttp\Pool;
+use GuzzleHttp\Promise\Create;
 use Psr\Cache\CacheItemPoolInterface;
+use Psr\Http\Message\ResponseInterface;
 use Psr\Log\LoggerInterface;
 use RuntimeException;
+use Throwable;
 use Symfony\Component\Cache\Adapter\FilesystemAdapter;
 
 /**
@@ -59,15 +61,25 @@ class CircuitBreakerOpen extends RuntimeException
 {
 }
 
+/**
+ * Exception raised for client errors (HTTP 4xx) that cannot succeed on retry.
+ *
+ * The HTTP status code is available via getCode().
+ */
+class ClientRequestError extends RuntimeException
+{
+}
+
 /**
  * Enterprise API client with rate limiting, retry logic, and circuit breaker.
  *
  * Features:
  * - Rate limiting with configurable limits
- * - Exponential backoff retry
- * - Response caching with TTL
+ * - Exponential backoff retry (server errors only; 4xx fail fast)
+ * - Response caching with TTL and ETag revalidation
  * - Circuit breaker pattern
  * - Request tracking and metrics
+ * - Concurrent fan-out GETs via getMany()
  *
  * Example:
  * ```php
@@ -93,7 +105,10 @@ class ApiClient
     private bool $enableCaching;
     private string $userAgent;
 
-    /** @var array<int> Request timestamps for rate limiting */
+    /** Optional PSR-3 logger for request diagnostics */
+    private ?LoggerInterface $logger;
+
+    /** @var array<float> Monotonic request timestamps (seconds, oldest first) for rate limiting */
     private array $requestTimestamps = [];
 
     /** @var CacheItemPoolInterface Response cache */
@@ -105,8 +120,8 @@ class ApiClient
     /** Circuit breaker failure count */
     private int $circuitFailureCount = 0;
 
-    /** Circuit breaker last failure time */
-    private ?DateTime $circuitLastFailure = null;
+    /** Circuit breaker last failure time (monotonic seconds) */
+    private ?float $circuitLastFailure = null;
 
     /** @var array<string, mixed> Request metrics */
     private array $metrics = [
@@ -115,12 +130,19 @@ class ApiClient
         'failed_requests' => 0,
         'cache_hits' => 0,
         'cache_misses' => 0,
+        'not_modified' => 0,
         'rate_limit_waits' => 0,
         'circuit_breaker_trips' => 0,
     ];
 
     public const VERSION = '04.00.04';
 
+    /** How long ETag validators outlive the fresh-response TTL (seconds) */
+    private const ETAG_TTL_SECONDS = 86400;
+
+    /** @var bool|null Whether the optional simdjson extension is loaded (null = not checked) */
+    private static ?bool $hasSimdjson = null;
+
     /**
      * Initialize API client.
      *
@@ -159,11 +181,15 @@ class ApiClient
         $this->circuitBreakerTimeout = $circuitBreakerTimeout;
         $this->enableCaching = $enableCaching;
         $this->userAgent = $userAgent;
+        $this->logger = $logger;
 
-        // Initialize HTTP client
+        // Initialize HTTP client. Negotiate HTTP/2 when libcurl supports it:
+        // concurrent requests from getMany() are then multiplexed over one
+        // TLS connection instead of each pool slot opening its own.
         $this->httpClient = new Client([
             'base_uri' => $this->baseUrl,
             'timeout' => 30,
+            'version' => self::supportsHttp2() ? 2.0 : 1.1,
             'headers' => [
                 'User-Agent' => $this->userAgent,
                 'Accept' => 'application/json',
@@ -217,6 +243,20 @@ class ApiClient
         return $this->request('PUT', $endpoint, ['json' => $data]);
     }
 
+    /**
+     * Perform PATCH request.
+     *
+     * @param string $endpoint API endpoint
+     * @param array<string, mixed> $data Request body data
+     * @return array<string, mixed> Response data
+     * @throws RateLimitExceeded
+     * @throws CircuitBreakerOpen
+     */
+    public function patch(string $endpoint, array $data = []): array
+    {
+        return $this->request('PATCH', $endpoint, ['json' => $data]);
+    }
+
     /**
      * Perform DELETE request.
      *
@@ -230,6 +270,177 @@ class ApiClient
         return $this->request('DELETE', $endpoint);
     }
 
+    /**
+     * Perform a GraphQL query.
+     *
+     * GraphQL reports most failures in an `errors` array of a 200 response;
+     * NOT_FOUND errors are raised as ClientRequestError (code 404) so callers
+     * can treat them like a REST 404, anything else as RuntimeException.
+     *
+     * GraphQL responses carry no ETag, so they are not cached by default. Read
+     * queries whose result may safely be a few minutes stale can pass a
+     * $cacheTtl; the `data` member is then kept in the response cache keyed
+     * by query and variables, and shared across processes like REST GETs.
+     *
+     * @param string $query GraphQL query document
+     * @param array<string, mixed> $variables Query variables
+     * @param int $cacheTtl Seconds to cache the result (0 = do not cache)
+     * @return array<string, mixed> The `data` member of the response
+     * @throws ClientRequestError
+     * @throws RateLimitExceeded
+     * @throws CircuitBreakerOpen
+     */
+    public function graphql(string $query, array $variables = [], int $cacheTtl = 0): array
+    {
+        $cachedItem = null;
+        if ($cacheTtl > 0 && $this->enableCaching) {
+            $cachedItem = $this->cache->getItem(md5('GRAPHQL_' . $query . '_' . json_encode($variables)));
+            if ($cachedItem->isHit()) {
+                $this->metrics['cache_hits']++;
+                return $cachedItem->get();
+            }
+            $this->metrics['cache_misses']++;
+        }
+
+        $response = $this->post('/graphql', ['query' => $query, 'variables' => (object) $variables]);
+
+        if (!empty($response['errors'])) {
+            $messages = implode('; ', array_map(
+                static fn(array $error): string => (string) ($error['message'] ?? 'Unknown error'),
+                $response['errors']
+            ));
+            foreach ($response['errors'] as $error) {
+                if (($error['type'] ?? '') === 'NOT_FOUND') {
+                    throw new ClientRequestError("GraphQL query failed: {$messages}", 404);
+                }
+            }
+            throw new RuntimeException("GraphQL query failed: {$messages}");
+        }
+
+        $data = $response['data'] ?? [];
+        if ($cachedItem !== null) {
+            $cachedItem->set($data);
+            $cachedItem->expiresAfter($cacheTtl);
+            $this->cache->save($cachedItem);
+        }
+
+        return $data;
+    }
+
+    /**
+     * Perform several independent GET requests concurrently.
+     *
+     * Requests share the client's connection pool and are kept in flight
+     * together (up to $concurrency), so fanning out over many repositories
+     * costs roughly one round-trip per batch instead of one per endpoint.
+     * Cached responses are served without a network call. Transient failures
+     * are retried serially through the normal retry path; client errors are
+     * returned as ClientRequestError rather than aborting the whole batch.
+     * The rate limiter is charged as each request is sent; a request over
+     * the limit is not sent and its RateLimitExceeded is returned instead.
+     *
+     * Example:
+     * ```php
+     * $repos = $client->getMany([
+     *     'standards' => '/repos/mokoconsulting-tech/MokoStandards',
+     *     'private'   => '/repos/mokoconsulting-tech/.github-private',
+     * ]);
+     * ```
+     *
+     * @param array<array-key, string> $endpoints API endpoints keyed by caller-chosen id
+     * @param int $concurrency Maximum number of requests in flight
+     * @return array<array-key, array<string, mixed>|Throwable> Response data (or the failure) keyed like $endpoints
+     * @throws CircuitBreakerOpen
+     */
+    public function getMany(array $endpoints, int $concurrency = 10): array
+    {
+        $this->checkCircuitBreaker();
+
+        $results = [];
+        $pending = [];
+        foreach ($endpoints as $key => $endpoint) {
+            $this->metrics['total_requests']++;
+            if ($this->enableCaching) {
+                $cachedItem = $this->cache->getItem($this->getCacheKey('GET', $endpoint, ['query' => []]));
+                if ($cachedItem->isHit()) {
+                    $this->metrics['cache_hits']++;
+                    $results[$key] = $cachedItem->get();
+                    continue;
+                }
+                $this->metrics['cache_misses']++;
+            }
+            $pending[$key] = $endpoint;
+        }
+
+        $options = [];
+        if ($this->authToken) {
+            $options['headers']['Authorization'] = 'Bearer ' . $this->authToken;
+        }
+
+        $retry = [];
+        $requests = function () use ($pending, $options) {
+            foreach ($pending as $key => $endpoint) {
+                yield $key => function () use ($endpoint, $options) {
+                    try {
+                        $this->checkRateLimit();
+                    } catch (RateLimitExceeded $e) {
+                        return Create::rejectionFor($e);
+                    }
+                    return $this->httpClient->getAsync($endpoint, $options);
+                };
+            }
+        };
+
+        $pool = new Pool($this->httpClient, $requests(), [
+            'concurrency' => max(1, $concurrency),
+            'fulfilled' => function (ResponseInterface $response, $key) use (&$results, $pending): void {
+                $data = $this->decodeResponse($response);
+                $this->metrics['successful_requests']++;
+                $this->recordSuccess();
+                $this->cacheResponse(
+                    $this->getCacheKey('GET', $pending[$key], ['query' => []]),
+                    $data,
+                    $response->getHeaderLine('ETag')
+                );
+                $results[$key] = $data;
+            },
+            'rejected' => function ($reason, $key) use (&$results, &$retry): void {
+                if ($reason instanceof RateLimitExceeded) {
+                    $results[$key] = $reason;
+                    return;
+                }
+                $status = $reason instanceof RequestException ? $reason->getResponse()?->getStatusCode() : null;
+                if ($status !== null && $status >= 400 && $status < 500 && $status !== 429) {
+                    $this->metrics['failed_requests']++;
+                    $results[$key] = new ClientRequestError(
+                        "Request failed with HTTP {$status}: " . $reason->getMessage(),
+                        $status,
+                        $reason
+                    );
+                    return;
+                }
+                $retry[] = $key;
+            },
+        ]);
+        $pool->promise()->wait();
+
+        foreach ($retry as $key) {
+            try {
+                $results[$key] = $this->requestWithRetry('GET', $pending[$key], $options);
+                $this->cacheResponse($this->getCacheKey('GET', $pending[$key], ['query' => []]), $results[$key]);
+            } catch (Throwable $e) {
+                $results[$key] = $e;
+            }
+        }
+
+        // Preserve the caller's ordering
+        $ordered = [];
+        foreach (array_keys($endpoints) as $key) {
+            $ordered[$key] = $results[$key];
+        }
+        return $ordered;
+    }
+
     /**
      * Perform HTTP request with rate limiting, caching, and resilience.
      *
@@ -251,13 +462,25 @@ class ApiClient
         $cacheKey = $this->getCacheKey($method, $endpoint, $options);
 
         // Check cache for GET requests
+        $validator = null;
         if ($method === 'GET' && $this->enableCaching) {
             $cachedItem = $this->cache->getItem($cacheKey);
             if ($cachedItem->isHit()) {
                 $this->metrics['cache_hits']++;
+                $this->logger?->debug('Cache hit for {method} {endpoint}', [
+                    'method' => $method,
+                    'endpoint' => $endpoint,
+                ]);
                 return $cachedItem->get();
             }
             $this->metrics['cache_misses']++;
+
+            // The fresh copy expired, but if we still hold its ETag we can ask
+            // GitHub to revalidate it: a 304 costs no primary rate-limit quota.
+            $validator = $this->cache->getItem($cacheKey . '_etag')->get();
+            if (is_array($validator)) {
+                $options['headers']['If-None-Match'] = $validator['etag'];
+            }
         }
 
         // Check rate limit
@@ -268,30 +491,116 @@ class ApiClient
             $options['headers']['Authorization'] = 'Bearer ' . $this->authToken;
         }
 
+        // Placeholders are interpolated by the logger only when the record is
+        // handled, and the nullsafe call skips building the context entirely
+        // when no logger is attached.
+        $this->logger?->debug('Requesting {method} {endpoint}', [
+            'method' => $method,
+            'endpoint' => $endpoint,
+        ]);
+
         // Perform request with retry logic
-        $response = $this->requestWithRetry($method, $endpoint, $options);
+        $httpResponse = $this->sendWithRetry($method, $endpoint, $options);
+
+        if ($httpResponse->getStatusCode() === 304 && is_array($validator)) {
+            $this->metrics['not_modified']++;
+            // Not-modified responses do not count against GitHub's quota, so
+            // give this request's slot back to the local limiter too.
+            array_pop($this->requestTimestamps);
+            $response = $validator['data'];
+        } else {
+            $response = $this->decodeResponse($httpResponse);
+        }
 
         // Cache successful GET responses
-        if ($method === 'GET' && $this->enableCaching) {
-            $cachedItem = $this->cache->getItem($cacheKey);
-            $cachedItem->set($response);
-            $cachedItem->expiresAfter($this->cacheTtlSeconds);
-            $this->cache->save($cachedItem);
+        if ($method === 'GET') {
+            $this->cacheResponse($cacheKey, $response, $httpResponse->getHeaderLine('ETag'));
         }
 
         return $response;
     }
 
     /**
-     * Perform request with exponential backoff retry.
+     * Store a successful GET response in the response cache.
+     *
+     * When the response carried an ETag, a longer-lived validator entry is
+     * kept alongside the fresh copy so the next request after expiry can be
+     * sent as a conditional If-None-Match request.
+     *
+     * @param string $cacheKey Cache key from getCacheKey()
+     * @param array<string, mixed> $response Response data
+     * @param string $etag ETag header value ('' when absent)
+     */
+    private function cacheResponse(string $cacheKey, array $response, string $etag = ''): void
+    {
+        if (!$this->enableCaching) {
+            return;
+        }
+
+        $cachedItem = $this->cache->getItem($cacheKey);
+        $cachedItem->set($response);
+        $cachedItem->expiresAfter($this->cacheTtlSeconds);
+        $this->cache->save($cachedItem);
+
+        if ($etag !== '') {
+            $validatorItem = $this->cache->getItem($cacheKey . '_etag');
+            $validatorItem->set(['etag' => $etag, 'data' => $response]);
+            $validatorItem->expiresAfter(self::ETAG_TTL_SECONDS);
+            $this->cache->save($validatorItem);
+        }
+    }
+
+    /**
+     * Perform request with exponential backoff retry and decode the body.
      *
      * @param string $method HTTP method
      * @param string $endpoint API endpoint
      * @param array<string, mixed> $options Request options
      * @return array<string, mixed> Response data
+     * @throws ClientRequestError On non-retryable 4xx responses
      * @throws RuntimeException
      */
     private function requestWithRetry(string $method, string $endpoint, array $options): array
+    {
+        return $this->decodeResponse($this->sendWithRetry($method, $endpoint, $options));
+    }
+
+    /**
+     * Decode a JSON response body.
+     *
+     * Uses the simdjson extension when it is installed — several times
+     * faster than ext-json on large bodies such as 100-node GraphQL pages —
+     * and falls back to json_decode() otherwise. Both yield the same arrays.
+     *
+     * @param ResponseInterface $response HTTP response
+     * @return array<string, mixed> Response data
+     */
+    private function decodeResponse(ResponseInterface $response): array
+    {
+        $body = (string) $response->getBody();
+        // 204 No Content (e.g. DELETE) and 304 Not Modified have nothing to parse
+        if ($body === '') {
+            return [];
+        }
+
+        if (self::$hasSimdjson ??= function_exists('simdjson_decode')) {
+            return \simdjson_decode($body, true, 512);
+        }
+
+        return json_decode($body, true, 512, JSON_THROW_ON_ERROR);
+    }
+
+    /**
+     * Send request with exponential backoff retry.
+     *
+     * @param string $method HTTP method
+     * @param string $endpoint API endpoint
+     * @param array<string, mixed> $options Request options
+     * @return ResponseInterface Successful (2xx/3xx) response
+     * @throws ClientRequestError On non-retryable 4xx responses
+     * @throws RuntimeException
+     */
+    private function sendWithRetry(string $method, string $endpoint, array $options): ResponseInterface
     {
         $attempt = 0;
         $lastException = null;
@@ -299,19 +608,41 @@ class ApiClient
         while ($attempt < $this->maxRetries) {
             try {
                 $response = $this->httpClient->request($method, $endpoint, $options);
-                $body = (string) $response->getBody();
-                $data = json_decode($body, true, 512, JSON_THROW_ON_ERROR);
 
                 $this->metrics['successful_requests']++;
                 $this->recordSuccess();
 
-                return $data;
+                return $response;
             } catch (GuzzleException $e) {
+                // Client errors are deterministic: retrying only burns rate-limit
+                // budget and adds backoff latency, and they say nothing about
+                // service health, so fail fast without touching the circuit breaker.
+                // 429 is the exception - it is GitHub telling us to slow down.
+                $status = $e instanceof RequestException ? $e->getResponse()?->getStatusCode() : null;
+                if ($status !== null && $status >= 400 && $status < 500 && $status !== 429) {
+                    $this->metrics['failed_requests']++;
+                    throw new ClientRequestError(
+                        "Request failed with HTTP {$status}: " . $e->getMessage(),
+                        $status,
+                        $e
+                    );
+                }
+
                 $lastException = $e;
                 $attempt++;
 
                 if ($attempt < $this->maxRetries) {
+                    // Add up to 50% random jitter so concurrent clients hitting the
+                    // same outage do not retry in lockstep.
                     $waitTime = $this->retryBackoffFactor ** $attempt;
+                    $waitTime += $waitTime * 0.5 * (mt_rand() / mt_getrandmax());
+                    $this->logger?->debug('Attempt {attempt}/{max} for {method} {endpoint} failed, retrying in {wait}s', [
+                        'attempt' => $attempt,
+                        'max' => $this->maxRetries,
+                        'method' => $method,
+                        'endpoint' => $endpoint,
+                        'wait' => $waitTime,
+                    ]);
                     usleep((int) ($waitTime * 1000000));
                 }
 
@@ -332,19 +663,12 @@ class ApiClient
      */
     private function checkRateLimit(): void
     {
-        $now = time();
-        $oneHourAgo = $now - 3600;
-
-        // Remove old timestamps
-        $this->requestTimestamps = array_filter(
-            $this->requestTimestamps,
-            fn($ts) => $ts > $oneHourAgo
-        );
+        $now = self::monotonicTime();
+        $this->pruneRequestTimestamps($now);
 
         // Check if limit exceeded
         if (count($this->requestTimestamps) >= $this->maxRequestsPerHour) {
-            $oldestTimestamp = min($this->requestTimestamps);
-            $waitTime = 3600 - ($now - $oldestTimestamp);
+            $waitTime = (int) ceil(3600 - ($now - $this->requestTimestamps[0]));
 
             $this->metrics['rate_limit_waits']++;
             
@@ -357,6 +681,29 @@ class ApiClient
         $this->requestTimestamps[] = $now;
     }
 
+    /**
+     * Drop request timestamps that have left the one-hour window.
+     *
+     * @param float $now Current monotonic time in seconds
+     */
+    private function pruneRequestTimestamps(float $now): void
+    {
+        $oneHourAgo = $now - 3600;
+
+        // Timestamps are appended in order, so expired entries form a prefix:
+        // count it and slice once instead of filtering the whole window.
+        $expired = 0;
+        foreach ($this->requestTimestamps as $ts) {
+            if ($ts > $oneHourAgo) {
+                break;
+            }
+            $expired++;
+        }
+        if ($expired > 0) {
+            $this->requestTimestamps = array_slice($this->requestTimestamps, $expired);
+        }
+    }
+
     /**
      * Check circuit breaker state.
      *
@@ -369,8 +716,7 @@ class ApiClient
         }
 
         if ($this->circuitState === CircuitState::OPEN) {
-            $now = new DateTime('now', new DateTimeZone('UTC'));
-            $timeSinceFailure = $now->getTimestamp() - $this->circuitLastFailure?->getTimestamp();
+            $timeSinceFailure = self::monotonicTime() - ($this->circuitLastFailure ?? 0.0);
 
             if ($timeSinceFailure >= $this->circuitBreakerTimeout) {
                 // Try half-open state
@@ -379,7 +725,7 @@ class ApiClient
             } else {
                 throw new CircuitBreakerOpen(
                     "Circuit breaker is open. Service unavailable. Retry in " .
-                    ($this->circuitBreakerTimeout - $timeSinceFailure) . " seconds."
+                    (int) ceil($this->circuitBreakerTimeout - $timeSinceFailure) . " seconds."
                 );
             }
         }
@@ -403,7 +749,7 @@ class ApiClient
     private function recordFailure(): void
     {
         $this->circuitFailureCount++;
-        $this->circuitLastFailure = new DateTime('now', new DateTimeZone('UTC'));
+        $this->circuitLastFailure = self::monotonicTime();
 
         if ($this->circuitFailureCount >= $this->circuitBreakerThreshold) {
             $this->circuitState = CircuitState::OPEN;
@@ -411,6 +757,31 @@ class ApiClient
         }
     }
 
+    /**
+     * Check whether the curl extension was built with HTTP/2 support.
+     *
+     * @return bool True if requests can negotiate HTTP/2
+     */
+    private static function supportsHttp2(): bool
+    {
+        return defined('CURL_VERSION_HTTP2')
+            && function_exists('curl_version')
+            && (curl_version()['features'] & CURL_VERSION_HTTP2) !== 0;
+    }
+
+    /**
+     * Current monotonic time in seconds.
+     *
+     * Immune to wall-clock adjustments (NTP, DST) and avoids allocating a
+     * DateTime on every rate-limit or circuit-breaker check.
+     *
+     * @return float Seconds from an arbitrary fixed point
+     */
+    private static function monotonicTime(): float
+    {
+        return hrtime(true) / 1e9;
+    }
+
     /**
      * Generate cache key for request.
      *
@@ -431,15 +802,27 @@ class ApiClient
     /**
      * Get current metrics.
      *
+     * The raw counters are returned as-is. The derived fields (circuit state
+     * and remaining hourly quota) need the rate-limit window pruned first, so
+     * they are only computed when $includeDerived is true; frequent pollers
+     * that only read counters can skip that work.
+     *
+     * @param bool $includeDerived Include circuit and rate-limit fields
      * @return array<string, mixed> Metrics data
      */
-    public function getMetrics(): array
+    public function getMetrics(bool $includeDerived = true): array
     {
-        return array_merge($this->metrics, [
+        if (!$includeDerived) {
+            return $this->metrics;
+        }
+
+        $this->pruneRequestTimestamps(self::monotonicTime());
+
+        return $this->metrics + [
             'circuit_state' => $this->circuitState->value,
             'circuit_failure_count' => $this->circuitFailureCount,
             'rate_limit_remaining' => max(0, $this->maxRequestsPerHour - count($this->requestTimestamps)),
-        ]);
+        ];
     }
 
     /**
@@ -81,6 +81,12 @@ class AuditLogger
     /** @var array Transaction stack */
     private array $transactionStack = [];
 
+    /** @var array<string> Encoded JSONL lines waiting to be appended to the log file */
+    private array $pendingLines = [];
+
+    /** @var int Buffered entries that trigger a file write */
+    private const FLUSH_THRESHOLD = 50;
+
     /** @var string Version constant */
     public const VERSION = '04.00.04';
 
@@ -179,7 +185,7 @@ class AuditLogger
      */
     private function getLogFilePath(): string
     {
-        $dateStr = (new DateTime('now', new DateTimeZone('UTC')))->format('Ymd');
+        $dateStr = gmdate('Ymd');
         return "{$this->logDir}/audit_{$this->service}_{$dateStr}.jsonl";
     }
 
@@ -208,7 +214,9 @@ class AuditLogger
     {
         if ($this->shouldRotateLog($logFile)) {
             $timestamp = (new DateTime('now', new DateTimeZone('UTC')))->format('His');
-            $rotatedFile = preg_replace('/\.jsonl$/', ".{$timestamp}.jsonl", $logFile);
+            // getLogFilePath() always ends in '.jsonl', so a plain substr
+            // does the job without going through the regex engine.
+            $rotatedFile = substr($logFile, 0, -strlen('.jsonl')) . ".{$timestamp}.jsonl";
             rename($logFile, $rotatedFile);
         }
     }
@@ -216,12 +224,21 @@ class AuditLogger
     /**
      * Write log entry to file and/or console.
      *
+     * File output is buffered and appended in batches by flush(), so a busy
+     * run takes the file lock and checks for rotation once per batch rather
+     * than once per entry. Errors, security events and transaction ends are
+     * flushed immediately so they are never lost with the buffer.
+     *
      * @param array $entry Log entry data
      */
     private function writeLogEntry(array $entry): void
     {
+        if (!$this->enableConsole && !$this->enableFile) {
+            return;
+        }
+
         // Add timestamp and session info
-        $entry['timestamp'] = (new DateTime('now', new DateTimeZone('UTC')))->format('c');
+        $entry['timestamp'] = gmdate('c');
         $entry['session_id'] = $this->sessionId;
         $entry['service'] = $this->service;
         $entry['user'] = $this->user;
@@ -234,14 +251,41 @@ class AuditLogger
 
         // File output
         if ($this->enableFile) {
-            $logFile = $this->getLogFilePath();
-            $this->rotateLogIfNeeded($logFile);
+            $this->pendingLines[] = json_encode($entry, JSON_UNESCAPED_SLASHES) . "\n";
 
-            $jsonLine = json_encode($entry, JSON_UNESCAPED_SLASHES) . "\n";
-            file_put_contents($logFile, $jsonLine, FILE_APPEND | LOCK_EX);
+            $urgent = $entry['event_type'] === 'security'
+                || ($entry['level'] ?? '') === 'error'
+                || ($entry['event_subtype'] ?? '') === 'transaction_end';
+            if ($urgent || count($this->pendingLines) >= self::FLUSH_THRESHOLD) {
+                $this->flush();
+            }
         }
     }
 
+    /**
+     * Append all buffered entries to the log file.
+     */
+    public function flush(): void
+    {
+        if (empty($this->pendingLines)) {
+            return;
+        }
+
+        $logFile = $this->getLogFilePath();
+        $this->rotateLogIfNeeded($logFile);
+
+        file_put_contents($logFile, implode('', $this->pendingLines), FILE_APPEND | LOCK_EX);
+        $this->pendingLines = [];
+    }
+
+    /**
+     * Write out any buffered entries when the logger goes away.
+     */
+    public function __destruct()
+    {
+        $this->flush();
+    }
+
     /**
      * Log a system event.
      *
@@ -384,7 +428,8 @@ class AuditTransaction
     private string $transactionId;
     private string $operation;
     private array $context;
-    private float $startTime;
+    /** Monotonic start time in nanoseconds (hrtime) */
+    private int $startTime;
 
     public function __construct(
         AuditLogger $logger,
@@ -396,7 +441,7 @@ class AuditTransaction
         $this->transactionId = $transactionId;
         $this->operation = $operation;
         $this->context = $context;
-        $this->startTime = microtime(true);
+        $this->startTime = hrtime(true);
 
         // Log transaction start
         $this->logger->logEvent($this->transactionId, 'transaction_start', [
@@ -445,7 +490,7 @@ class AuditTransaction
      */
     public function end(?string $status = 'success', array $result = []): void
     {
-        $duration = microtime(true) - $this->startTime;
+        $duration = (hrtime(true) - $this->startTime) / 1e9;
 
         $this->logger->logEvent($this->transactionId, 'transaction_end', [
             'operation' => $this->operation,
@@ -209,7 +209,7 @@ abstract class CLIApp
                 $this->log("DRY RUN MODE - No changes will be made", 'INFO');
             }
 
-            $startTime = microtime(true);
+            $startTime = hrtime(true);
             
             if ($this->metrics !== null) {
                 $timer = $this->metrics->startTimer('main_execution');
@@ -219,7 +219,7 @@ abstract class CLIApp
                 $exitCode = $this->run();
             }
 
-            $duration = microtime(true) - $startTime;
+            $duration = (hrtime(true) - $startTime) / 1e9;
             $this->log(sprintf("Completed {$this->name} with exit code %d (%.2fs)", $exitCode, $duration), 'INFO');
 
             if ($this->metrics !== null && !$this->quiet) {
@@ -285,6 +285,32 @@ abstract class CLIApp
         }
     }
 
+    /**
+     * Log several messages at the same level with a single write
+     *
+     * Reports that print one line per repository would otherwise issue one
+     * write per line; here every line shares one timestamp and the block is
+     * written in one go.
+     *
+     * @param array<string> $messages Messages to log, in order
+     * @param string $level Log level
+     */
+    protected function logLines(array $messages, string $level = 'INFO'): void
+    {
+        if (empty($messages) || ($this->quiet && $level !== 'ERROR') || (!$this->verbose && $level === 'DEBUG')) {
+            return;
+        }
+
+        $prefix = '[' . gmdate('Y-m-d H:i:s') . "] {$level}: ";
+        $formatted = $prefix . implode("\n" . $prefix, $messages) . "\n";
+
+        if ($level === 'ERROR') {
+            fwrite(STDERR, $formatted);
+        } else {
+            echo $formatted;
+        }
+    }
+
     /**
      * Print result in appropriate format
      *
@@ -347,7 +373,11 @@ abstract class CLIApp
             'reset' => "\033[0m",
         ];
 
-        if (isset($colors[$color]) && posix_isatty(STDOUT)) {
+        // Whether STDOUT is a terminal cannot change mid-run; probe it once.
+        static $isTty = null;
+        $isTty ??= posix_isatty(STDOUT);
+
+        if (isset($colors[$color]) && $isTty) {
             echo $colors[$color] . $text . $colors['reset'];
         } else {
             echo $text;
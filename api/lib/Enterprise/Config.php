@@ -89,6 +89,9 @@ class Config
         ],
     ];
 
+    /** @var array<string> Environment variables checked for a GitHub token, in priority order */
+    private const TOKEN_ENV_VARS = ['GH_TOKEN', 'GITHUB_TOKEN'];
+
     /** @var array<string, mixed> Configuration data */
     private array $configData;
 
@@ -98,6 +101,9 @@ class Config
     /** @var array<string, mixed> Runtime override data */
     private array $overrideData = [];
 
+    /** @var string|null Process-wide `gh auth token` result (null = not yet resolved) */
+    private static ?string $ghCliToken = null;
+
     public const VERSION = '04.00.04';
 
     /**
@@ -169,9 +175,9 @@ class Config
                 $key = trim($key);
                 $value = trim($value);
 
-                // Remove quotes if present
-                if (preg_match('/^(["\'])(.*)\\1$/', $value, $matches)) {
-                    $value = $matches[2];
+                // Remove matching surrounding quotes if present
+                if (strlen($value) >= 2 && ($value[0] === '"' || $value[0] === "'") && $value[-1] === $value[0]) {
+                    $value = substr($value, 1, -1);
                 }
 
                 // Set environment variable
@@ -192,8 +198,17 @@ class Config
         //   1. GH_TOKEN env var (GitHub Actions org/repo secret)
         //   2. GITHUB_TOKEN env var (GitHub Actions built-in)
         //   3. `gh auth token` from the gh CLI (local developer machines)
-        $token = getenv('GH_TOKEN') ?: getenv('GITHUB_TOKEN') ?: self::resolveGhCliToken();
-        if (!empty($token)) {
+        $token = '';
+        foreach (self::TOKEN_ENV_VARS as $var) {
+            $token = (string) getenv($var);
+            if ($token !== '') {
+                break;
+            }
+        }
+        if ($token === '') {
+            $token = self::resolveGhCliToken();
+        }
+        if ($token !== '') {
             $configData['github']['token'] = $token;
         }
         if ($org = getenv('GITHUB_ORG')) {
@@ -213,25 +228,63 @@ class Config
      * validates the output matches a known GitHub token prefix before returning
      * it. Returns an empty string when gh is not installed, not authenticated,
      * or the output is not a recognisable token.
+     *
+     * The result is memoised for the lifetime of the process so repeated
+     * Config::load() calls do not spawn gh again; use clearTokenCache() to
+     * force a fresh lookup.
      */
     private static function resolveGhCliToken(): string
     {
+        if (self::$ghCliToken !== null) {
+            return self::$ghCliToken;
+        }
+
+        if (!self::isGhCliAvailable()) {
+            return self::$ghCliToken = '';
+        }
+
+        // stderr is never inspected, so send it straight to the null device
+        // rather than allocating a pipe that has to be drained and closed.
         $nullDevice = PHP_OS_FAMILY === 'Windows' ? 'NUL' : '/dev/null';
         $proc = proc_open(
             ['gh', 'auth', 'token'],
-            [0 => ['file', $nullDevice, 'r'], 1 => ['pipe', 'w'], 2 => ['pipe', 'w']],
+            [0 => ['file', $nullDevice, 'r'], 1 => ['pipe', 'w'], 2 => ['file', $nullDevice, 'w']],
             $pipes
         );
         if (!is_resource($proc)) {
-            return '';
+            return self::$ghCliToken = '';
         }
-        $output = trim(stream_get_contents($pipes[1]));
+        $output = trim((string) stream_get_contents($pipes[1]));
         fclose($pipes[1]);
-        fclose($pipes[2]);
         proc_close($proc);
 
         // Accept only strings that look like a real GitHub token
-        return preg_match('/^(ghp_|github_pat_|gho_|ghu_|ghs_)\S+$/', $output) ? $output : '';
+        return self::$ghCliToken = preg_match('/^(ghp_|github_pat_|gho_|ghu_|ghs_)\S+$/', $output) ? $output : '';
+    }
+
+    /**
+     * Check whether the gh CLI binary is present on PATH.
+     *
+     * Scans PATH directly instead of shelling out, so machines without gh
+     * never pay for a failed process spawn.
+     */
+    private static function isGhCliAvailable(): bool
+    {
+        $binary = PHP_OS_FAMILY === 'Windows' ? 'gh.exe' : 'gh';
+        foreach (explode(PATH_SEPARATOR, (string) getenv('PATH')) as $dir) {
+            if ($dir !== '' && is_executable($dir . DIRECTORY_SEPARATOR . $binary)) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Forget the memoised gh CLI token (e.g. after `gh auth login` or in tests).
+     */
+    public static function clearTokenCache(): void
+    {
+        self::$ghCliToken = null;
     }
 
     /**
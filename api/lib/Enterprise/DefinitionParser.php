@@ -19,6 +19,9 @@ declare(strict_types=1);
 
 namespace MokoEnterprise;
 
+use Psr\Cache\CacheItemPoolInterface;
+use Symfony\Component\Cache\Adapter\FilesystemAdapter;
+
 /**
  * Definition Parser
  *
@@ -61,6 +64,32 @@ class DefinitionParser
 	/** Directory containing the base definition files */
 	private const DEFINITIONS_DIR = 'api/definitions/default';
 
+	/**
+	 * Parsed entries per definition path, with the mtime and size they were
+	 * parsed from.
+	 *
+	 * @var array<string, array{mtime: int, size: int, entries: array}>
+	 */
+	private array $parsedFiles = [];
+
+	/** @var array<string, string|null> Definition path per repo root and platform; null when none exists */
+	private array $resolvedPaths = [];
+
+	/** Parsed entries persisted across processes, keyed by path, mtime and size */
+	private CacheItemPoolInterface $cache;
+
+	/**
+	 * @param CacheItemPoolInterface|null $cache  Cache for parsed definitions (default: filesystem cache in the temp dir)
+	 */
+	public function __construct(?CacheItemPoolInterface $cache = null)
+	{
+		$this->cache = $cache ?? new FilesystemAdapter(
+			'definition_parser',
+			0,
+			sys_get_temp_dir() . '/mokostandards/definition_cache'
+		);
+	}
+
 	// -----------------------------------------------------------------------
 	// Public API
 	// -----------------------------------------------------------------------
@@ -74,15 +103,24 @@ class DefinitionParser
 	 */
 	public function parseForPlatform(string $platform, string $repoRoot): array
 	{
-		$basename = self::PLATFORM_DEFINITION_MAP[$platform] ?? self::FALLBACK_DEFINITION;
-		$path = rtrim($repoRoot, '/') . '/' . self::DEFINITIONS_DIR . '/' . $basename;
-
-		if (!file_exists($path)) {
-			$fallback = rtrim($repoRoot, '/') . '/' . self::DEFINITIONS_DIR . '/' . self::FALLBACK_DEFINITION;
-			if (!file_exists($fallback)) {
-				return [];
+		// Resolve each platform once, remembering a missing definition too,
+		// so repositories on an unknown platform don't re-probe the disk.
+		$key = $repoRoot . "\0" . $platform;
+		if (!array_key_exists($key, $this->resolvedPaths)) {
+			$basename = self::PLATFORM_DEFINITION_MAP[$platform] ?? self::FALLBACK_DEFINITION;
+			$path = rtrim($repoRoot, '/') . '/' . self::DEFINITIONS_DIR . '/' . $basename;
+
+			if (!file_exists($path)) {
+				$fallback = rtrim($repoRoot, '/') . '/' . self::DEFINITIONS_DIR . '/' . self::FALLBACK_DEFINITION;
+				$path = file_exists($fallback) ? $fallback : null;
 			}
-			$path = $fallback;
+
+			$this->resolvedPaths[$key] = $path;
+		}
+
+		$path = $this->resolvedPaths[$key];
+		if ($path === null) {
+			return [];
 		}
 
 		return $this->parseFile($path);
@@ -96,16 +134,42 @@ class DefinitionParser
 	 */
 	public function parseFile(string $filePath): array
 	{
-		if (!file_exists($filePath)) {
+		$stat = @stat($filePath);
+		if ($stat === false) {
 			return [];
 		}
 
-		$content = file_get_contents($filePath);
-		if ($content === false) {
-			return [];
+		// A bulk sync resolves the same few platform definitions once per
+		// repository; reuse the parse while the file is unchanged on disk.
+		$cached = $this->parsedFiles[$filePath] ?? null;
+		if ($cached !== null && $cached['mtime'] === $stat['mtime'] && $cached['size'] === $stat['size']) {
+			return $cached['entries'];
+		}
+
+		// Repeated runs (CI retries, one sync per platform) find the parse in
+		// the persistent cache; the key changes whenever the file does, so
+		// stale entries are simply never read again.
+		$cacheItem = $this->cache->getItem(md5($filePath . '|' . $stat['mtime'] . '|' . $stat['size']));
+		if ($cacheItem->isHit()) {
+			$entries = $cacheItem->get();
+		} else {
+			$content = file_get_contents($filePath);
+			if ($content === false) {
+				return [];
+			}
+
+			$entries = $this->parse($content);
+			$cacheItem->set($entries);
+			$this->cache->save($cacheItem);
 		}
 
-		return $this->parse($content);
+		$this->parsedFiles[$filePath] = [
+			'mtime'   => $stat['mtime'],
+			'size'    => $stat['size'],
+			'entries' => $entries,
+		];
+
+		return $entries;
 	}
 
 	/**
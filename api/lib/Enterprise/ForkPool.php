@@ -0,0 +1,97 @@
+<?php
+
+declare(strict_types=1);
+
+/**
+ * Fork Pool - Run independent chunks of work in forked worker processes
+ *
+ * Copyright (C) 2026 Moko Consulting <hello@mokoconsulting.tech>
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ * @package MokoStandards\Enterprise
+ * @version 04.00.04
+ * @author MokoStandards Team
+ * @license GPL-3.0-or-later
+ */
+
+namespace MokoEnterprise;
+
+/**
+ * Minimal pcntl-based worker pool.
+ *
+ * Each chunk is handed to its own forked child, which runs the callback and
+ * reports the returned array back through a temporary file. Chunks whose
+ * worker could not be forked or did not report come back as null, so the
+ * caller can run them in the parent instead.
+ *
+ * Example:
+ * ```php
+ * if (ForkPool::isAvailable()) {
+ *     $results = ForkPool::map(array_chunk($paths, 100), fn(array $chunk): array => scan($chunk));
+ * }
+ * ```
+ */
+class ForkPool
+{
+    /**
+     * Whether worker processes can be forked (pcntl and posix extensions)
+     */
+    public static function isAvailable(): bool
+    {
+        return function_exists('pcntl_fork') && function_exists('posix_kill');
+    }
+
+    /**
+     * Run $work on every chunk, one forked worker per chunk
+     *
+     * Results travel back serialized with classes disallowed, so $work must
+     * return plain data (arrays and scalars).
+     *
+     * @param array<array-key, mixed> $chunks Units of work
+     * @param callable(mixed): array $work Callback run in the worker for one chunk
+     * @return array<array-key, array|null> Worker result per chunk, keyed like $chunks;
+     *                                      null where no worker reported
+     */
+    public static function map(array $chunks, callable $work): array
+    {
+        $children = [];
+
+        foreach ($chunks as $index => $chunk) {
+            $resultFile = tempnam(sys_get_temp_dir(), 'moko_fork_');
+            $pid = $resultFile === false ? -1 : pcntl_fork();
+
+            if ($pid === 0) {
+                try {
+                    file_put_contents($resultFile, serialize($work($chunk)));
+                } finally {
+                    // The worker must never return into the parent's copied
+                    // call stack, even when $work throws. SIGKILL also skips
+                    // the destructors inherited from the parent (buffered log
+                    // writers would otherwise flush twice); exit() is the
+                    // fallback should the signal fail.
+                    posix_kill(posix_getpid(), SIGKILL);
+                    exit(1);
+                }
+            }
+
+            $children[$index] = [$pid, $resultFile];
+        }
+
+        $results = [];
+        foreach ($children as $index => [$pid, $resultFile]) {
+            $result = null;
+            if ($pid > 0) {
+                pcntl_waitpid($pid, $status);
+                $data = @file_get_contents($resultFile);
+                $result = $data === false || $data === '' ? null : unserialize($data, ['allowed_classes' => false]);
+            }
+            if ($resultFile !== false) {
+                @unlink($resultFile);
+            }
+            $results[$index] = is_array($result) ? $result : null;
+        }
+
+        return $results;
+    }
+}
@@ -63,6 +63,35 @@ class InputValidator
 {
     public const VERSION = '04.00.04';
 
+    /** @var array<string, string> Version format patterns, keyed by format type */
+    private const VERSION_PATTERNS = [
+        // Semantic versioning: MAJOR.MINOR.PATCH
+        'semver' => '/^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$/',
+        // MokoStandards format: XX.YY.ZZ
+        'moko' => '/^\d{2}\.\d{2}\.\d{2}$/',
+        // Simple format: X.Y or X.Y.Z
+        'simple' => '/^\d+\.\d+(\.\d+)?$/',
+    ];
+
+    /** @var array<string, string> Error message per version format type */
+    private const VERSION_ERRORS = [
+        'semver' => 'Invalid semver format: %s. Expected: MAJOR.MINOR.PATCH',
+        'moko' => 'Invalid MokoStandards version format: %s. Expected: XX.YY.ZZ',
+        'simple' => 'Invalid version format: %s',
+    ];
+
+    /** @var array<string, string> Shell metacharacters mapped to '' for strtr() */
+    private const SHELL_STRIP_MAP = [
+        ';' => '', '&' => '', '|' => '', '`' => '', '$' => '', '(' => '',
+        ')' => '', '<' => '', '>' => '', "\n" => '', "\r" => '',
+    ];
+
+    /** @var array<string, array<string, true>> Lower-cased extension sets, keyed by the list that produced them */
+    private static array $extensionSets = [];
+
+    /** Simple but effective email pattern */
+    private const EMAIL_PATTERN = '/^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$/';
+
     /**
      * Validate and sanitize file paths to prevent path traversal.
      *
@@ -83,12 +112,15 @@ class InputValidator
             throw new ValidationError("Path must be a non-empty string");
         }
 
-        // Check for path traversal attempts
-        if (strpos($path, '..') !== false) {
+        // Check for path traversal attempts. Only a whole '..' component
+        // traverses; names such as 'my..file.txt' are legitimate. The cheap
+        // substring test keeps the split off the common path.
+        if (str_contains($path, '..') && in_array('..', preg_split('#[/\\\\]#', $path), true)) {
             throw new ValidationError("Path traversal detected (..)");
         }
 
         // Resolve to absolute path if not allowing relative
+        $resolved = false;
         if (!$allowRelative) {
             $realPath = realpath($path);
             if ($realPath === false && $mustExist) {
@@ -96,11 +128,12 @@ class InputValidator
             }
             if ($realPath !== false) {
                 $path = $realPath;
+                $resolved = true;
             }
         }
 
-        // Check if path must exist
-        if ($mustExist && !file_exists($path)) {
+        // Check if path must exist (a successful realpath() already proved it)
+        if ($mustExist && !$resolved && !file_exists($path)) {
             throw new ValidationError("Path does not exist: {$path}");
         }
 
@@ -108,8 +141,12 @@ class InputValidator
         if ($allowedExtensions !== null) {
             $extension = pathinfo($path, PATHINFO_EXTENSION);
             if ($extension !== '') {
-                $allowedLower = array_map('strtolower', $allowedExtensions);
-                if (!in_array(strtolower($extension), $allowedLower, true)) {
+                // Callers validate many paths against the same whitelist, so
+                // build its lower-cased lookup set once and reuse it.
+                $setKey = implode("\0", $allowedExtensions);
+                $allowed = self::$extensionSets[$setKey]
+                    ??= array_fill_keys(array_map('strtolower', $allowedExtensions), true);
+                if (!isset($allowed[strtolower($extension)])) {
                     throw new ValidationError(
                         "Invalid file extension: .{$extension}. " .
                         "Allowed: " . implode(', ', $allowedExtensions)
@@ -135,37 +172,14 @@ class InputValidator
             throw new ValidationError("Version must be a non-empty string");
         }
 
-        switch ($formatType) {
-            case 'semver':
-                // Semantic versioning: MAJOR.MINOR.PATCH
-                $pattern = '/^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$/';
-                if (!preg_match($pattern, $version)) {
-                    throw new ValidationError(
-                        "Invalid semver format: {$version}. Expected: MAJOR.MINOR.PATCH"
-                    );
-                }
-                break;
-
-            case 'moko':
-                // MokoStandards format: XX.YY.ZZ
-                $pattern = '/^\d{2}\.\d{2}\.\d{2}$/';
-                if (!preg_match($pattern, $version)) {
-                    throw new ValidationError(
-                        "Invalid MokoStandards version format: {$version}. Expected: XX.YY.ZZ"
-                    );
-                }
-                break;
-
-            case 'simple':
-                // Simple format: X.Y or X.Y.Z
-                $pattern = '/^\d+\.\d+(\.\d+)?$/';
-                if (!preg_match($pattern, $version)) {
-                    throw new ValidationError("Invalid version format: {$version}");
-                }
-                break;
+        // One table lookup picks the pattern instead of a switch per format
+        $pattern = self::VERSION_PATTERNS[$formatType] ?? null;
+        if ($pattern === null) {
+            throw new ValidationError("Unknown version format type: {$formatType}");
+        }
 
-            default:
-                throw new ValidationError("Unknown version format type: {$formatType}");
+        if (!preg_match($pattern, $version)) {
+            throw new ValidationError(sprintf(self::VERSION_ERRORS[$formatType], $version));
         }
 
         return $version;
@@ -184,15 +198,41 @@ class InputValidator
             throw new ValidationError("Email must be a non-empty string");
         }
 
-        // Simple but effective email regex
-        $pattern = '/^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$/';
-        if (!preg_match($pattern, $email)) {
+        // Anything without an '@' followed by a '.' can never match; reject it
+        // with a byte scan before running the regex engine.
+        $at = strpos($email, '@');
+        if ($at === false || strpos($email, '.', $at) === false || !preg_match(self::EMAIL_PATTERN, $email)) {
             throw new ValidationError("Invalid email format: {$email}");
         }
 
         return strtolower($email);
     }
 
+    /**
+     * Check many email addresses at once.
+     *
+     * Unlike validateEmail() this does not throw or normalise; it reports
+     * which entries are valid. The pattern is applied with preg_grep(), so
+     * the per-value loop runs inside PCRE rather than in PHP.
+     *
+     * @param iterable<array-key, string> $emails Email addresses to check
+     * @return array<array-key, bool> Validity of each entry, keyed as the input
+     */
+    public static function validateEmailsBulk(iterable $emails): array
+    {
+        if (!is_array($emails)) {
+            $emails = iterator_to_array($emails);
+        }
+
+        $valid = preg_grep(self::EMAIL_PATTERN, $emails);
+
+        $result = [];
+        foreach ($emails as $key => $_) {
+            $result[$key] = isset($valid[$key]);
+        }
+        return $result;
+    }
+
     /**
      * Validate URLs and check schemes.
      *
@@ -207,7 +247,8 @@ class InputValidator
             throw new ValidationError("URL must be a non-empty string");
         }
 
-        $parsed = parse_url($url);
+        // Absolute URLs always contain '://'; skip parse_url() for the rest.
+        $parsed = str_contains($url, '://') ? parse_url($url) : false;
         if ($parsed === false || !isset($parsed['scheme']) || !isset($parsed['host'])) {
             throw new ValidationError("Invalid URL format: {$url}");
         }
@@ -230,11 +271,9 @@ class InputValidator
      */
     public static function sanitizeShellInput(string $input): string
     {
-        // Remove dangerous shell characters
-        $dangerousChars = [';', '&', '|', '`', '$', '(', ')', '<', '>', "\n", "\r"];
-        $sanitized = str_replace($dangerousChars, '', $input);
-        
-        return trim($sanitized);
+        // Remove dangerous shell characters in a single pass over the input;
+        // str_replace() with a search array rescans the string once per entry.
+        return trim(strtr($input, self::SHELL_STRIP_MAP));
     }
 
     /**
@@ -245,7 +284,9 @@ class InputValidator
      */
     public static function sanitizeSqlInput(string $input): string
     {
-        // Remove SQL injection patterns
+        // Remove SQL injection patterns. These stay sequential on purpose:
+        // removing one pattern can join its neighbours into another (e.g.
+        // "-'-" becomes "--"), which a single-pass strtr() would let through.
         $dangerousPatterns = ["'", '"', '--', '/*', '*/', 'xp_', 'sp_'];
         $sanitized = str_replace($dangerousPatterns, '', $input);
         
@@ -342,6 +383,7 @@ class InputValidator
  * - Fluent interface for chaining validations
  * - Accumulates errors instead of throwing immediately
  * - Single validation call at the end
+ * - Optional fail-fast mode that throws on the first failed check
  *
  * Example:
  * ```php
@@ -358,17 +400,37 @@ class Validator
     private string $name;
     /** @var array<string> */
     private array $errors = [];
+    private bool $failFast;
 
     /**
      * Initialize validator.
      *
      * @param mixed $value Value to validate
      * @param string $name Name of the value (for error messages)
+     * @param bool $failFast Throw on the first failed check instead of accumulating errors
      */
-    public function __construct(mixed $value, string $name = 'value')
+    public function __construct(mixed $value, string $name = 'value', bool $failFast = false)
     {
         $this->value = $value;
         $this->name = $name;
+        $this->failFast = $failFast;
+    }
+
+    /**
+     * Record a failed check.
+     *
+     * In fail-fast mode this throws straight away, so the remaining checks
+     * in the chain never run.
+     *
+     * @param string $message Error message
+     * @throws ValidationError If fail-fast mode is enabled
+     */
+    private function addError(string $message): void
+    {
+        $this->errors[] = $message;
+        if ($this->failFast) {
+            $this->validate();
+        }
     }
 
     /**
@@ -386,7 +448,7 @@ class Validator
             }
             InputValidator::validateString($this->value, $minLength, $maxLength);
         } catch (ValidationError $e) {
-            $this->errors[] = $e->getMessage();
+            $this->addError($e->getMessage());
         }
         return $this;
     }
@@ -403,7 +465,7 @@ class Validator
         try {
             InputValidator::validateInteger($this->value, $minValue, $maxValue);
         } catch (ValidationError $e) {
-            $this->errors[] = $e->getMessage();
+            $this->addError($e->getMessage());
         }
         return $this;
     }
@@ -421,7 +483,7 @@ class Validator
             }
             InputValidator::validateEmail($this->value);
         } catch (ValidationError $e) {
-            $this->errors[] = $e->getMessage();
+            $this->addError($e->getMessage());
         }
         return $this;
     }
@@ -440,7 +502,7 @@ class Validator
             }
             InputValidator::validateUrl($this->value, $allowedSchemes);
         } catch (ValidationError $e) {
-            $this->errors[] = $e->getMessage();
+            $this->addError($e->getMessage());
         }
         return $this;
     }
@@ -454,7 +516,7 @@ class Validator
     public function matches(string $pattern): self
     {
         if (!preg_match($pattern, (string) $this->value)) {
-            $this->errors[] = "{$this->name} does not match pattern: {$pattern}";
+            $this->addError("{$this->name} does not match pattern: {$pattern}");
         }
         return $this;
     }
@@ -495,3 +557,150 @@ class Validator
         return !empty($this->errors);
     }
 }
+
+/**
+ * Reusable validation rules applied to many values.
+ *
+ * Builds the same rule chain as Validator once, then checks any number of
+ * values against it. Useful when many rows share one rule set (form
+ * processing, CSV import), where rebuilding a Validator per value would
+ * dominate.
+ *
+ * Example:
+ * ```php
+ * $schema = (new ValidatorSchema())
+ *     ->isString(minLength: 5, maxLength: 100)
+ *     ->isEmail();
+ * foreach ($rows as $row) {
+ *     $email = $schema->validate($row['email'], 'email');
+ * }
+ * ```
+ */
+class ValidatorSchema
+{
+    /** @var array<callable(mixed, string): ?string> Checks returning an error message or null */
+    private array $checks = [];
+
+    /**
+     * Require a string value.
+     *
+     * @param int|null $minLength Minimum length
+     * @param int|null $maxLength Maximum length
+     * @return self
+     */
+    public function isString(?int $minLength = null, ?int $maxLength = null): self
+    {
+        $this->checks[] = static function (mixed $value) use ($minLength, $maxLength): ?string {
+            if (!is_string($value)) {
+                return "Value must be a string";
+            }
+            InputValidator::validateString($value, $minLength, $maxLength);
+            return null;
+        };
+        return $this;
+    }
+
+    /**
+     * Require an integer value.
+     *
+     * @param int|null $minValue Minimum value
+     * @param int|null $maxValue Maximum value
+     * @return self
+     */
+    public function isInteger(?int $minValue = null, ?int $maxValue = null): self
+    {
+        $this->checks[] = static function (mixed $value) use ($minValue, $maxValue): ?string {
+            InputValidator::validateInteger($value, $minValue, $maxValue);
+            return null;
+        };
+        return $this;
+    }
+
+    /**
+     * Require a valid email.
+     *
+     * @return self
+     */
+    public function isEmail(): self
+    {
+        $this->checks[] = static function (mixed $value): ?string {
+            if (!is_string($value)) {
+                return "Email must be a string";
+            }
+            InputValidator::validateEmail($value);
+            return null;
+        };
+        return $this;
+    }
+
+    /**
+     * Require a valid URL.
+     *
+     * @param array<string>|null $allowedSchemes Allowed URL schemes
+     * @return self
+     */
+    public function isUrl(?array $allowedSchemes = null): self
+    {
+        $this->checks[] = static function (mixed $value) use ($allowedSchemes): ?string {
+            if (!is_string($value)) {
+                return "URL must be a string";
+            }
+            InputValidator::validateUrl($value, $allowedSchemes);
+            return null;
+        };
+        return $this;
+    }
+
+    /**
+     * Require the value to match a regex pattern.
+     *
+     * @param string $pattern Regex pattern
+     * @return self
+     * @throws InvalidArgumentException If the pattern does not compile
+     */
+    public function matches(string $pattern): self
+    {
+        // Compile once here so a bad pattern fails at schema build time
+        // rather than on every value.
+        if (@preg_match($pattern, '') === false) {
+            throw new InvalidArgumentException("Invalid regex pattern: {$pattern}");
+        }
+
+        $this->checks[] = static function (mixed $value, string $name) use ($pattern): ?string {
+            return preg_match($pattern, (string) $value)
+                ? null
+                : "{$name} does not match pattern: {$pattern}";
+        };
+        return $this;
+    }
+
+    /**
+     * Validate a value against every rule.
+     *
+     * @param mixed $value Value to validate
+     * @param string $name Name of the value (for error messages)
+     * @return mixed The validated value
+     * @throws ValidationError If validation failed
+     */
+    public function validate(mixed $value, string $name = 'value'): mixed
+    {
+        $errors = [];
+        foreach ($this->checks as $check) {
+            try {
+                $error = $check($value, $name);
+            } catch (ValidationError $e) {
+                $error = $e->getMessage();
+            }
+            if ($error !== null) {
+                $errors[] = $error;
+            }
+        }
+
+        if ($errors !== []) {
+            $errorMsg = "Validation failed for {$name}:\n";
+            $errorMsg .= implode("\n", array_map(fn($e) => "  - {$e}", $errors));
+            throw new ValidationError($errorMsg);
+        }
+        return $value;
+    }
+}
@@ -40,38 +40,32 @@ declare(strict_types=1);
 
 namespace MokoEnterprise;
 
-use DateTime;
-use DateTimeZone;
-
 /**
  * Timer class for timing operations
  */
 class MetricsTimer
 {
-    private MetricsCollector $collector;
-    private string $metricName;
-    private array $labels;
-    private float $startTime;
+    private readonly MetricsCollector $collector;
+    private readonly string $metricName;
+    private readonly array $labels;
+    /** Monotonic start time in nanoseconds (hrtime) */
+    private readonly int $startTime;
 
     public function __construct(MetricsCollector $collector, string $metricName, array $labels = [])
     {
         $this->collector = $collector;
         $this->metricName = $metricName;
         $this->labels = $labels;
-        $this->startTime = microtime(true);
+        $this->startTime = hrtime(true);
     }
 
     public function stop(bool $success = true): float
     {
-        $duration = microtime(true) - $this->startTime;
-        $this->collector->observe($this->metricName . '_duration_seconds', $duration, $this->labels);
-        
-        if ($success) {
-            $this->collector->increment($this->metricName . '_success_total', 1, $this->labels);
-        } else {
-            $this->collector->increment($this->metricName . '_failure_total', 1, $this->labels);
-        }
-        
+        // hrtime() is monotonic, so NTP adjustments cannot produce negative
+        // durations; the integer nanoseconds are converted only here.
+        $duration = (hrtime(true) - $this->startTime) / 1e9;
+        $this->collector->recordTiming($this->metricName, $duration, $success, $this->labels);
+
         return $duration;
     }
 }
@@ -86,13 +80,20 @@ class MetricsCollector
     private string $serviceName;
     private array $counters = [];
     private array $gauges = [];
+    /** @var array<string, array{count: int, sum: float, min: float, max: float}> Running histogram aggregates */
     private array $histograms = [];
-    private float $startTime;
+    /** Monotonic start time in nanoseconds (hrtime) */
+    private int $startTime;
+    /** @var array<string, string> Labelled metric keys already built by makeKey() */
+    private array $keyCache = [];
+
+    /** Upper bound on cached labelled keys before the cache is reset */
+    private const KEY_CACHE_SIZE = 4096;
 
     public function __construct(string $serviceName = 'mokostandards')
     {
         $this->serviceName = $serviceName;
-        $this->startTime = microtime(true);
+        $this->startTime = hrtime(true);
     }
 
     /**
@@ -105,10 +106,7 @@ class MetricsCollector
     public function increment(string $metricName, int $value = 1, array $labels = []): void
     {
         $key = $this->makeKey($metricName, $labels);
-        if (!isset($this->counters[$key])) {
-            $this->counters[$key] = 0;
-        }
-        $this->counters[$key] += $value;
+        $this->counters[$key] = ($this->counters[$key] ?? 0) + $value;
     }
 
     /**
@@ -133,11 +131,58 @@ class MetricsCollector
      */
     public function observe(string $metricName, float $value, array $labels = []): void
     {
-        $key = $this->makeKey($metricName, $labels);
+        $this->observeKey($this->makeKey($metricName, $labels), $value);
+    }
+
+    /**
+     * Record the outcome of a timed operation
+     *
+     * Used by MetricsTimer::stop(). The duration and success/failure series
+     * share one label set, so the key is built once and its label suffix
+     * reused for the counter instead of going through makeKey() twice.
+     *
+     * @internal
+     * @param string $metricName Base name of the timed operation
+     * @param float $duration Elapsed time in seconds
+     * @param bool $success Whether the operation succeeded
+     * @param array<string, string> $labels Optional labels for the metric
+     */
+    public function recordTiming(string $metricName, float $duration, bool $success, array $labels = []): void
+    {
+        $durationName = $metricName . '_duration_seconds';
+        $durationKey = $this->makeKey($durationName, $labels);
+        $labelSuffix = substr($durationKey, strlen($durationName));
+
+        $this->observeKey($durationKey, $duration);
+
+        $counterKey = $metricName . ($success ? '_success_total' : '_failure_total') . $labelSuffix;
+        $this->counters[$counterKey] = ($this->counters[$counterKey] ?? 0) + 1;
+    }
+
+    /**
+     * Add an observation to the histogram under an already-built key
+     *
+     * @param string $key Metric key including labels
+     * @param float $value Value to observe
+     */
+    private function observeKey(string $key, float $value): void
+    {
+        // Keep running aggregates instead of every observation: memory stays
+        // constant however long the process runs, and stats are O(1).
         if (!isset($this->histograms[$key])) {
-            $this->histograms[$key] = [];
+            $this->histograms[$key] = ['count' => 1, 'sum' => $value, 'min' => $value, 'max' => $value];
+            return;
+        }
+
+        $histogram = &$this->histograms[$key];
+        $histogram['count']++;
+        $histogram['sum'] += $value;
+        if ($value < $histogram['min']) {
+            $histogram['min'] = $value;
+        }
+        if ($value > $histogram['max']) {
+            $histogram['max'] = $value;
         }
-        $this->histograms[$key][] = $value;
     }
 
     /**
@@ -164,6 +209,17 @@ class MetricsCollector
         if (empty($labels)) {
             return $metricName;
         }
+
+        // The same (name, labels) pairs recur on every increment and timer
+        // stop; serialize() is a single C call, far cheaper than sorting and
+        // formatting the label set again.
+        $cacheKey = $metricName . serialize($labels);
+        if (isset($this->keyCache[$cacheKey])) {
+            return $this->keyCache[$cacheKey];
+        }
+        if (count($this->keyCache) >= self::KEY_CACHE_SIZE) {
+            $this->keyCache = [];
+        }
         
         ksort($labels);
         $labelPairs = [];
@@ -171,7 +227,7 @@ class MetricsCollector
             $labelPairs[] = sprintf('%s="%s"', $key, $value);
         }
         
-        return sprintf('%s{%s}', $metricName, implode(',', $labelPairs));
+        return $this->keyCache[$cacheKey] = sprintf('%s{%s}', $metricName, implode(',', $labelPairs));
     }
 
     /**
@@ -204,19 +260,18 @@ class MetricsCollector
      */
     public function getHistogramStats(string $metricName): array
     {
-        $values = $this->histograms[$metricName] ?? [];
+        $histogram = $this->histograms[$metricName] ?? null;
         
-        if (empty($values)) {
+        if ($histogram === null) {
             return ['count' => 0, 'min' => 0.0, 'max' => 0.0, 'avg' => 0.0, 'sum' => 0.0];
         }
         
-        $sum = array_sum($values);
         return [
-            'count' => count($values),
-            'min' => min($values),
-            'max' => max($values),
-            'avg' => $sum / count($values),
-            'sum' => $sum
+            'count' => $histogram['count'],
+            'min' => $histogram['min'],
+            'max' => $histogram['max'],
+            'avg' => $histogram['sum'] / $histogram['count'],
+            'sum' => $histogram['sum']
         ];
     }
 
@@ -227,44 +282,84 @@ class MetricsCollector
      */
     public function exportPrometheus(): string
     {
-        $lines = [];
-        $now = new DateTime('now', new DateTimeZone('UTC'));
-        
-        $lines[] = sprintf('# Metrics for %s', $this->serviceName);
-        $lines[] = sprintf('# Generated at %s', $now->format('c'));
-        $lines[] = '';
-        
-        // Export counters
+        return implode("\n", iterator_to_array($this->iterPrometheus(), false));
+    }
+
+    /**
+     * Write metrics in Prometheus format to a stream
+     *
+     * Lines are written as they are generated, so a large registry can be
+     * served without holding the whole document in memory.
+     *
+     * @param resource $stream Writable stream, e.g. fopen('php://output', 'w')
+     */
+    public function writePrometheus($stream): void
+    {
+        $first = true;
+        foreach ($this->iterPrometheus() as $line) {
+            fwrite($stream, $first ? $line : "\n" . $line);
+            $first = false;
+        }
+    }
+
+    /**
+     * Generate Prometheus text format lines one at a time
+     *
+     * @return \Generator<int, string> Output lines without trailing newlines
+     */
+    public function iterPrometheus(): \Generator
+    {
+        yield "# Metrics for {$this->serviceName}";
+        yield '# Generated at ' . gmdate('c');
+        yield '';
+
+        // A TYPE line describes a metric family, not a labelled series, so it
+        // is written once per base name rather than once per key.
+        $typed = [];
+
         foreach ($this->counters as $key => $value) {
-            $lines[] = sprintf('# TYPE %s counter', $this->stripLabels($key));
-            $lines[] = sprintf('%s %d', $key, $value);
+            $name = $this->stripLabels($key);
+            if (!isset($typed[$name])) {
+                $typed[$name] = true;
+                yield "# TYPE {$name} counter";
+            }
+            yield $key . ' ' . (int) $value;
         }
-        
-        // Export gauges
+
         foreach ($this->gauges as $key => $value) {
-            $lines[] = sprintf('# TYPE %s gauge', $this->stripLabels($key));
-            $lines[] = sprintf('%s %s', $key, $value);
+            $name = $this->stripLabels($key);
+            if (!isset($typed[$name])) {
+                $typed[$name] = true;
+                yield "# TYPE {$name} gauge";
+            }
+            yield "{$key} {$value}";
         }
-        
-        // Export histograms
-        foreach ($this->histograms as $key => $values) {
-            if (!empty($values)) {
-                $stats = $this->getHistogramStats($key);
-                $lines[] = sprintf('# TYPE %s histogram', $this->stripLabels($key));
-                $lines[] = sprintf('%s_count %d', $key, $stats['count']);
-                $lines[] = sprintf('%s_sum %s', $key, $stats['sum']);
-                $lines[] = sprintf('%s_min %s', $key, $stats['min']);
-                $lines[] = sprintf('%s_max %s', $key, $stats['max']);
-                $lines[] = sprintf('%s_avg %s', $key, $stats['avg']);
+
+        foreach ($this->histograms as $key => $histogram) {
+            $name = $this->stripLabels($key);
+            if (!isset($typed[$name])) {
+                $typed[$name] = true;
+                yield "# TYPE {$name} histogram";
             }
+            yield "{$key}_count {$histogram['count']}";
+            yield "{$key}_sum {$histogram['sum']}";
+            yield "{$key}_min {$histogram['min']}";
+            yield "{$key}_max {$histogram['max']}";
+            yield "{$key}_avg " . ($histogram['sum'] / $histogram['count']);
         }
-        
-        // Add uptime
-        $uptime = microtime(true) - $this->startTime;
-        $lines[] = '# TYPE process_uptime_seconds gauge';
-        $lines[] = sprintf('process_uptime_seconds %.2f', $uptime);
-        
-        return implode("\n", $lines);
+
+        yield '# TYPE process_uptime_seconds gauge';
+        yield sprintf('process_uptime_seconds %.2f', $this->getUptime());
+    }
+
+    /**
+     * Seconds elapsed since the collector was created
+     *
+     * @return float Uptime in seconds
+     */
+    private function getUptime(): float
+    {
+        return (hrtime(true) - $this->startTime) / 1e9;
     }
 
     /**
@@ -318,8 +413,7 @@ class MetricsCollector
             }
         }
         
-        $uptime = microtime(true) - $this->startTime;
-        echo sprintf("\nUptime: %.2f seconds\n", $uptime);
+        echo sprintf("\nUptime: %.2f seconds\n", $this->getUptime());
         echo str_repeat('=', 60) . "\n\n";
     }
 
@@ -39,6 +39,9 @@ class RepositoryHealthChecker
         'percentage' => 0.0,
         'level' => 'unknown',
     ];
+
+    /** @var array{passed: array, failed: array}|null Checks split by outcome, built on first request */
+    private ?array $checksByOutcome = null;
     
     /**
      * Constructor
@@ -76,8 +79,10 @@ class RepositoryHealthChecker
         
         // Record metrics
         $this->metrics->setGauge('repo_health_score', $this->results['percentage']);
+        // addCheck() already tallies passes per category; sum those rather
+        // than filtering every check through a closure again.
         $this->metrics->setGauge('repo_health_checks_passed', 
-            count(array_filter($this->results['checks'], fn($c) => $c['passed'])));
+            array_sum(array_column($this->results['categories'], 'checks_passed')));
         
         $this->logger->logInfo("Health check complete: {$this->results['percentage']}% ({$this->results['level']})");
         
@@ -97,6 +102,7 @@ class RepositoryHealthChecker
             'percentage' => 0.0,
             'level' => 'unknown',
         ];
+        $this->checksByOutcome = null;
     }
     
     /**
@@ -227,6 +233,7 @@ class RepositoryHealthChecker
      */
     private function addCheck(string $category, string $name, bool $passed, int $points): void
     {
+        $this->checksByOutcome = null;
         $this->results['checks'][] = [
             'category' => $category,
             'name' => $name,
@@ -281,7 +288,7 @@ class RepositoryHealthChecker
      */
     public function getFailedChecks(): array
     {
-        return array_filter($this->results['checks'], fn($c) => !$c['passed']);
+        return $this->getChecksByOutcome()['failed'];
     }
     
     /**
@@ -291,7 +298,28 @@ class RepositoryHealthChecker
      */
     public function getPassedChecks(): array
     {
-        return array_filter($this->results['checks'], fn($c) => $c['passed']);
+        return $this->getChecksByOutcome()['passed'];
+    }
+    
+    /**
+     * Split checks into passed and failed in a single pass
+     *
+     * Results do not change between check() runs, so the split is kept
+     * until the next addCheck() or resetResults() rather than refiltered
+     * on every call.
+     *
+     * @return array{passed: array, failed: array} Checks keyed by original position
+     */
+    private function getChecksByOutcome(): array
+    {
+        if ($this->checksByOutcome === null) {
+            $split = ['passed' => [], 'failed' => []];
+            foreach ($this->results['checks'] as $position => $check) {
+                $split[$check['passed'] ? 'passed' : 'failed'][$position] = $check;
+            }
+            $this->checksByOutcome = $split;
+        }
+        return $this->checksByOutcome;
     }
     
     /**
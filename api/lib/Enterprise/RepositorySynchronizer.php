@@ -21,6 +21,7 @@ namespace MokoEnterprise;
 
 use Exception;
 use RuntimeException;
+use Throwable;
 
 /**
  * Repository Synchronizer
@@ -32,6 +33,34 @@ class RepositorySynchronizer
 {
     private const SYNC_DEFINITION_DIR = 'api/definitions/sync';
     private const SYNC_OVERRIDE_FILE  = '.github/override.tf';
+    private const SYNC_BRANCH         = 'chore/sync-mokostandards-updates';
+    private const SYNC_PR_TITLE       = 'chore: Sync MokoStandards workflows and configurations';
+
+    /**
+     * Repository listing query. `repositoryOwner` resolves to either an
+     * Organization or a User, so one query serves both account types.
+     * `$archived: false` has GitHub drop archived repositories server-side;
+     * null applies no filter.
+     */
+    private const LIST_REPOSITORIES_QUERY = <<<'GRAPHQL'
+        query($owner: String!, $first: Int!, $cursor: String, $archived: Boolean) {
+          repositoryOwner(login: $owner) {
+            repositories(first: $first, after: $cursor, isArchived: $archived, ownerAffiliations: [OWNER], orderBy: {field: NAME, direction: ASC}) {
+              nodes { name nameWithOwner isArchived isPrivate }
+              pageInfo { hasNextPage endCursor }
+            }
+          }
+        }
+        GRAPHQL;
+
+    /** Largest page GitHub serves for a repositories connection */
+    private const REPO_PAGE_SIZE = 100;
+
+    /** Default lifetime in seconds of cached repository listing pages */
+    private const REPO_LIST_CACHE_TTL = 300;
+
+    /** Seconds a getRepositories() result is reused within this process */
+    private const REPO_LIST_MEMO_TTL = 30;
 
     private ApiClient         $apiClient;
     private AuditLogger       $logger;
@@ -39,6 +68,18 @@ class RepositorySynchronizer
     private CheckpointManager $checkpoints;
     private DefinitionParser  $definitionParser;
 
+    /** @var array<string, bool> Prefetched override-file presence, keyed by "org/repo" */
+    private array $overrideFlags = [];
+
+    /** @var array<string, array{0: float, 1: array}> Recent getRepositories() results: [fetched at, repos] */
+    private array $repoListMemo = [];
+
+    /** @var array<string, true> Repositories the listing reported as archived, keyed by "org/repo" */
+    private array $archivedRepos = [];
+
+    /** @var array<string, array> Full repository metadata loaded on demand, keyed by "org/repo" */
+    private array $repoDetails = [];
+
     /**
      * Constructor
      */
@@ -57,49 +98,128 @@ class RepositorySynchronizer
     }
     
     /**
-     * Get list of repositories for an organization
+     * Get list of repositories for an organization or user account
      * 
-     * @param string $org Organization name
+     * @param string $org Organization or user login
      * @param bool $skipArchived Whether to skip archived repositories
+     * @param int|null $limit Maximum number of repositories to return (null = all)
      * @return array Array of repository information
+     * @throws ClientRequestError When the owner does not exist
      */
-    public function getRepositories(string $org, bool $skipArchived = false): array
+    public function getRepositories(string $org, bool $skipArchived = false, ?int $limit = null): array
     {
-        $repos = [];
-        $page = 1;
+        // Callers often list the same owner more than once per run; reuse a
+        // result from the last few seconds without touching the API or the
+        // filesystem cache at all.
+        $memoKey = "{$org}|" . (int) $skipArchived . '|' . ($limit ?? '');
+        $memo = $this->repoListMemo[$memoKey] ?? null;
+        if ($memo !== null && hrtime(true) / 1e9 - $memo[0] < self::REPO_LIST_MEMO_TTL) {
+            return $memo[1];
+        }
+
+        $pages = [];
+        $cursor = null;
+        $remaining = $limit ?? PHP_INT_MAX;
+
+        // Listing pages are cached per (owner, cursor) so back-to-back runs —
+        // bulk sync followed by a dry run, say — skip the GraphQL round-trips
+        // entirely. MOKO_REPO_CACHE_TTL=0 always fetches a fresh listing.
+        $ttlEnv = getenv('MOKO_REPO_CACHE_TTL');
+        $cacheTtl = $ttlEnv === false || $ttlEnv === '' ? self::REPO_LIST_CACHE_TTL : (int) $ttlEnv;
         
-        while (true) {
-            $response = $this->apiClient->get("/orgs/{$org}/repos", [
-                'type' => 'all',
-                'per_page' => 100,
-                'page' => $page,
-            ]);
+        while ($remaining > 0) {
+            // Ask only for what is still needed, so a limit stops pagination
+            // at the page boundary instead of fetching and discarding nodes.
+            $data = $this->apiClient->graphql(self::LIST_REPOSITORIES_QUERY, [
+                'owner' => $org,
+                'first' => min(self::REPO_PAGE_SIZE, $remaining),
+                'cursor' => $cursor,
+                'archived' => $skipArchived ? false : null,
+            ], $cacheTtl);
             
-            if (empty($response)) {
-                break;
+            $connection = $data['repositoryOwner']['repositories'] ?? null;
+            if ($connection === null) {
+                throw new ClientRequestError("Repository owner not found: {$org}", 404);
             }
             
-            foreach ($response as $repo) {
-                if ($skipArchived && ($repo['archived'] ?? false)) {
-                    continue;
-                }
-                
-                $repos[] = [
-                    'name' => $repo['name'],
-                    'full_name' => $repo['full_name'],
-                    'archived' => $repo['archived'] ?? false,
-                    'private' => $repo['private'] ?? false,
-                ];
-            }
+            // Archived repositories were already filtered out by the server
+            // when requested, so each page is mapped as a whole. Pages are
+            // joined once after the loop, so the result array is sized a
+            // single time instead of regrowing on every page.
+            $page = array_map(self::repoFromNode(...), $connection['nodes'] ?? []);
+            $pages[] = $page;
+            $remaining -= count($page);
             
-            $page++;
+            $cursor = $connection['pageInfo']['endCursor'] ?? null;
+            if (!($connection['pageInfo']['hasNextPage'] ?? false) || $cursor === null) {
+                break;
+            }
+        }
+
+        $repos = array_merge(...$pages);
+        foreach ($repos as $repo) {
+            if ($repo['archived']) {
+                $this->archivedRepos["{$org}/{$repo['name']}"] = true;
+            }
         }
-        
         $this->metrics->setGauge('repositories_found', count($repos));
+        $this->repoListMemo[$memoKey] = [hrtime(true) / 1e9, $repos];
         
         return $repos;
     }
+
+    /**
+     * Forget memoised repository listings
+     *
+     * @param string|null $org Owner whose listings to forget (null = all owners)
+     */
+    public function invalidateRepositoryCache(?string $org = null): void
+    {
+        if ($org === null) {
+            $this->repoListMemo = [];
+            return;
+        }
+
+        foreach (array_keys($this->repoListMemo) as $key) {
+            if (str_starts_with($key, "{$org}|")) {
+                unset($this->repoListMemo[$key]);
+            }
+        }
+    }
     
+    /**
+     * Build a repository summary from a GraphQL repository node
+     *
+     * @param array<string, mixed> $node Repository node from LIST_REPOSITORIES_QUERY
+     * @return array{name: string, full_name: string, archived: bool, private: bool}
+     */
+    private static function repoFromNode(array $node): array
+    {
+        return [
+            'name' => $node['name'],
+            'full_name' => $node['nameWithOwner'],
+            'archived' => (bool) ($node['isArchived'] ?? false),
+            'private' => (bool) ($node['isPrivate'] ?? false),
+        ];
+    }
+
+    /**
+     * Get full metadata for a single repository
+     *
+     * getRepositories() only projects the fields needed to list and filter
+     * (name, full_name, archived, private). Anything else — default branch,
+     * description, topics, language — is fetched here the first time it is
+     * needed and reused for the rest of the run.
+     *
+     * @param string $org Organization name
+     * @param string $repo Repository name
+     * @return array Repository metadata as returned by GET /repos/{owner}/{repo}
+     */
+    public function getRepositoryDetail(string $org, string $repo): array
+    {
+        return $this->repoDetails["{$org}/{$repo}"] ??= $this->apiClient->get("/repos/{$org}/{$repo}");
+    }
+
     /**
      * Check if repository has override file
      * 
@@ -109,6 +229,10 @@ class RepositorySynchronizer
      */
     public function hasOverrideFile(string $org, string $repo): bool
     {
+        if (isset($this->overrideFlags["{$org}/{$repo}"])) {
+            return $this->overrideFlags["{$org}/{$repo}"];
+        }
+
         try {
             $override = $this->apiClient->get("/repos/{$org}/{$repo}/contents/" . self::SYNC_OVERRIDE_FILE);
             return !empty($override);
@@ -117,6 +241,53 @@ class RepositorySynchronizer
         }
     }
     
+    /**
+     * Probe many repositories for an override file concurrently
+     *
+     * The repository listing itself is a cursor chain and cannot be fetched
+     * out of order, but the per-repository override probes that follow it are
+     * independent. Issuing them together keeps several requests in flight, so
+     * a bulk run pays roughly one round-trip per batch instead of one per
+     * repository. Concurrency defaults to 4 and can be tuned with the
+     * MOKO_PREFETCH_CONCURRENCY environment variable.
+     *
+     * The prefetch is best-effort: if it fails (rate limit, open circuit
+     * breaker, ...) the failure is logged and the affected flags stay unset,
+     * so hasOverrideFile() falls back to probing that repository itself.
+     *
+     * @param string $org Organization name
+     * @param array<string> $repos Repository names
+     */
+    public function prefetchOverrideFlags(string $org, array $repos): void
+    {
+        $endpoints = [];
+        foreach ($repos as $repo) {
+            if (!isset($this->overrideFlags["{$org}/{$repo}"]) && !isset($this->archivedRepos["{$org}/{$repo}"])) {
+                $endpoints["{$org}/{$repo}"] = "/repos/{$org}/{$repo}/contents/" . self::SYNC_OVERRIDE_FILE;
+            }
+        }
+        if (empty($endpoints)) {
+            return;
+        }
+
+        $concurrency = (int) (getenv('MOKO_PREFETCH_CONCURRENCY') ?: 4);
+        try {
+            $results = $this->apiClient->getMany($endpoints, $concurrency);
+        } catch (Throwable $e) {
+            $this->logger->logWarning("Override file prefetch failed, probing per repository: " . $e->getMessage());
+            return;
+        }
+
+        foreach ($results as $key => $result) {
+            if (is_array($result)) {
+                $this->overrideFlags[$key] = !empty($result);
+            } elseif ($result instanceof ClientRequestError) {
+                $this->overrideFlags[$key] = false;
+            }
+            // Anything else was transient; hasOverrideFile() will retry it.
+        }
+    }
+
     /**
      * Process single repository
      * 
@@ -132,6 +303,15 @@ class RepositorySynchronizer
         $txn = $this->logger->startTransaction("process_repo_{$repo}");
         
         try {
+            // Archived repositories are read-only: any sync attempt would spend
+            // the override probe, metadata and ref lookups only to be refused
+            // on the first write, so skip them before any API call.
+            if (isset($this->archivedRepos["{$org}/{$repo}"])) {
+                $this->logger->logInfo("Repository {$repo} is archived, skipping");
+                $txn->end('success');
+                return false;
+            }
+
             // Check for override file
             if ($this->hasOverrideFile($org, $repo)) {
                 $this->logger->logInfo("Repository {$repo} has override file, parsing configuration");
@@ -183,7 +363,7 @@ class RepositorySynchronizer
         $repoRoot = dirname(dirname(dirname(__DIR__)));
 
         // Detect platform from GitHub repo metadata
-        $repoInfo = $this->apiClient->get("/repos/{$org}/{$repo}");
+        $repoInfo = $this->getRepositoryDetail($org, $repo);
         $platform = $this->detectPlatform($repoInfo);
         $this->logger->logInfo("Detected platform for {$repo}: {$platform}");
 
@@ -229,7 +409,7 @@ class RepositorySynchronizer
         try {
             $prs = $this->apiClient->get("/repos/{$org}/{$repo}/pulls", [
                 'state' => 'open',
-                'head' => "{$org}:chore/sync-mokostandards-updates",
+                'head' => "{$org}:" . self::SYNC_BRANCH,
             ]);
             
             if (!empty($prs) && is_array($prs)) {
@@ -420,9 +600,9 @@ HCL;
         $nullResult = ['number' => null, 'summary' => []];
 
         try {
-            $repoInfo      = $this->apiClient->get("/repos/{$org}/{$repo}");
+            $repoInfo      = $this->getRepositoryDetail($org, $repo);
             $defaultBranch = $repoInfo['default_branch'] ?? 'main';
-            $branchName    = 'chore/sync-mokostandards-updates';
+            $branchName    = self::SYNC_BRANCH;
 
             $this->logger->logInfo("Creating sync PR for {$org}/{$repo}");
 
@@ -448,6 +628,10 @@ HCL;
 
             $summary = ['copied' => [], 'skipped' => [], 'total' => 0];
 
+            // The placeholder map depends only on the target repo, so build it
+            // once here rather than once per synced file.
+            $placeholders = $this->buildTemplatePlaceholders($repo, $org, $platform);
+
             foreach ($filesToSync as $entry) {
                 $summary['total']++;
                 $targetPath   = $entry['destination'];
@@ -474,7 +658,7 @@ HCL;
                     }
                 }
 
-                $content = $this->processTemplateContent($content, $repo, $org, $platform);
+                $content = $this->processTemplateContent($content, $placeholders);
 
                 try {
                     $existingFile = $this->apiClient->get("/repos/{$org}/{$repo}/contents/{$targetPath}", [
@@ -519,7 +703,7 @@ HCL;
             }
 
             $prData   = $this->apiClient->post("/repos/{$org}/{$repo}/pulls", [
-                'title' => 'chore: Sync MokoStandards workflows and configurations',
+                'title' => self::SYNC_PR_TITLE,
                 'head'  => $branchName,
                 'base'  => $defaultBranch,
                 'body'  => $this->generatePRBody($summary),
@@ -539,22 +723,31 @@ HCL;
     }
     
     /**
-     * Process template content (remove placeholders, etc.)
+     * Build the template replacement map for a target repository
+     *
+     * @return array<string, string>
      */
-    private function processTemplateContent(string $content, string $repo, string $org = '', string $platform = ''): string
+    private function buildTemplatePlaceholders(string $repo, string $org = '', string $platform = ''): array
     {
-        // Remove .template references if any
-        $content = str_replace('.yml.template', '.yml', $content);
-
-        // Replace all repository-specific placeholders in a single pass
-        $content = strtr($content, [
-            '{{repo_name}}'        => $repo,
-            '{{org}}'              => $org,
-            '{{platform}}'         => $platform,
+        return [
+            // Remove .template references if any
+            '.yml.template'         => '.yml',
+            '{{repo_name}}'         => $repo,
+            '{{org}}'               => $org,
+            '{{platform}}'          => $platform,
             '{{standards_version}}' => Config::VERSION,
-        ]);
+        ];
+    }
 
-        return $content;
+    /**
+     * Process template content (remove placeholders, etc.)
+     *
+     * @param array<string, string> $placeholders Map from buildTemplatePlaceholders()
+     */
+    private function processTemplateContent(string $content, array $placeholders): string
+    {
+        // .template references and repository-specific placeholders in a single pass
+        return strtr($content, $placeholders);
     }
     
     /**
@@ -607,13 +800,14 @@ HCL;
      * Synchronize multiple repositories
      * 
      * @param string $org Organization name
-     * @param array $options Sync options (repo, skipArchived, dryRun, force)
+     * @param array $options Sync options (repo, skipArchived, limit, dryRun, force)
      * @return array Sync results with statistics
      */
     public function synchronize(string $org, array $options = []): array
     {
         $specificRepo = $options['repo'] ?? null;
         $skipArchived = $options['skipArchived'] ?? false;
+        $limit = $options['limit'] ?? null;
         $dryRun = $options['dryRun'] ?? false;
         $force = $options['force'] ?? false;
         
@@ -621,11 +815,13 @@ HCL;
         
         try {
             // Get list of repositories
-            $repos = $this->getRepositories($org, $skipArchived);
+            $repos = $this->getRepositories($org, $skipArchived, $specificRepo ? null : $limit);
             
             if ($specificRepo) {
                 $repos = array_filter($repos, fn($repo) => $repo['name'] === $specificRepo);
             }
+
+            $this->prefetchOverrideFlags($org, array_column($repos, 'name'));
             
             $total = count($repos);
             $results = [
@@ -40,8 +40,10 @@ declare(strict_types=1);
 namespace MokoEnterprise;
 
 use Exception;
+use RecursiveCallbackFilterIterator;
 use RecursiveDirectoryIterator;
 use RecursiveIteratorIterator;
+use SplFileInfo;
 
 /**
  * Exception raised when security violations are detected
@@ -59,15 +61,19 @@ class SecurityValidator
 
     /**
      * Common patterns for credentials and secrets
+     *
+     * Each entry is [pattern, description, trigger]. The trigger is a
+     * lower-case literal every match must contain; the regex is skipped for
+     * text without it.
      */
     private const CREDENTIAL_PATTERNS = [
-        ['/password\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded password'],
-        ['/api[_-]?key\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded API key'],
-        ['/secret[_-]?key\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded secret key'],
-        ['/token\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded token'],
-        ['/aws[_-]?access[_-]?key[_-]?id\s*=\s*["\']([^"\']+)["\']/i', 'AWS access key'],
-        ['/private[_-]?key\s*=\s*["\']([^"\']+)["\']/i', 'private key'],
-        ['/["\'][A-Za-z0-9\/+]{40,}["\']/i', 'potential secret (base64)'],
+        ['/password\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded password', 'password'],
+        ['/api[_-]?key\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded API key', 'api'],
+        ['/secret[_-]?key\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded secret key', 'secret'],
+        ['/token\s*=\s*["\']([^"\']+)["\']/i', 'hardcoded token', 'token'],
+        ['/aws[_-]?access[_-]?key[_-]?id\s*=\s*["\']([^"\']+)["\']/i', 'AWS access key', 'aws'],
+        ['/private[_-]?key\s*=\s*["\']([^"\']+)["\']/i', 'private key', 'private'],
+        ['/["\']([A-Za-z0-9\/+]{40,})["\']/', 'potential secret (base64)', null],
     ];
 
     /**
@@ -94,7 +100,57 @@ class SecurityValidator
         0666, // rw-rw-rw-
     ];
 
+    /**
+     * Severities shown by printReport(), in report order
+     */
+    private const REPORT_SEVERITIES = ['critical', 'high', 'medium', 'low', 'warning'];
+
+    /**
+     * Directories skipped by scanDirectory()
+     */
+    private const SKIPPED_DIRECTORIES = [
+        '.git' => true,
+        'node_modules' => true,
+    ];
+
+    /**
+     * Default upper bound on the size of a scanned file, in bytes
+     */
+    public const MAX_SCAN_BYTES = 2 * 1024 * 1024;
+
+    /**
+     * Bytes read to decide whether a file is binary
+     */
+    private const BINARY_PROBE_BYTES = 4096;
+
+    /**
+     * Tokens marking a matched credential as a placeholder, as one alternation
+     */
+    private const PLACEHOLDER_PATTERN = '/your_|example|placeholder|xxx|test|dummy|sample|replace|changeme|todo/i';
+
+    /**
+     * Upper bound on remembered placeholder verdicts before the cache is reset
+     */
+    private const PLACEHOLDER_CACHE_SIZE = 4096;
+
+    /** @var array<string, bool> Placeholder verdicts keyed by matched value */
+    private static array $placeholderCache = [];
+
+    /** Combined dangerous-function regex, built on first use */
+    private static ?string $dangerousFunctionPattern = null;
+
     private array $findings = [];
+    /** @var array<string, array<int, int>> Positions in $findings keyed by severity */
+    private array $severityIndex = [];
+    private int $maxScanBytes;
+
+    /**
+     * @param int $maxScanBytes Files larger than this are skipped with a warning
+     */
+    public function __construct(int $maxScanBytes = self::MAX_SCAN_BYTES)
+    {
+        $this->maxScanBytes = $maxScanBytes;
+    }
 
     /**
      * Scan a file for security issues
@@ -108,6 +164,24 @@ class SecurityValidator
         string $filePath,
         bool $checkCredentials = true,
         bool $checkDangerousFunctions = true
+    ): array {
+        $findings = $this->collectFileFindings($filePath, $checkCredentials, $checkDangerousFunctions);
+        $this->recordFindings($findings);
+        return $findings;
+    }
+
+    /**
+     * Scan a file without recording the findings on the validator
+     *
+     * @param string $filePath Path to file to scan
+     * @param bool $checkCredentials Check for hardcoded credentials
+     * @param bool $checkDangerousFunctions Check for dangerous function usage
+     * @return array<int, array<string, mixed>> List of security findings
+     */
+    private function collectFileFindings(
+        string $filePath,
+        bool $checkCredentials = true,
+        bool $checkDangerousFunctions = true
     ): array {
         $findings = [];
 
@@ -116,8 +190,43 @@ class SecurityValidator
         }
 
         try {
-            $content = file_get_contents($filePath);
+            // filesize() is served from the stat cache file_exists() filled.
+            $size = filesize($filePath);
+            if ($size === 0) {
+                return $findings;
+            }
+            if ($size > $this->maxScanBytes) {
+                $findings[] = [
+                    'severity' => 'warning',
+                    'type' => 'scan_skipped',
+                    'file' => $filePath,
+                    'message' => sprintf('File skipped: %d bytes exceeds scan limit of %d', $size, $this->maxScanBytes)
+                ];
+                return $findings;
+            }
 
+            $handle = @fopen($filePath, 'rb');
+            if ($handle === false) {
+                throw new Exception('unable to read file');
+            }
+            try {
+                // A NUL byte in the first block marks a binary file, which
+                // cannot hold source-level credentials; stop before reading
+                // the rest of it.
+                $content = fread($handle, self::BINARY_PROBE_BYTES);
+                if ($content === false) {
+                    throw new Exception('unable to read file');
+                }
+                if ($content === '' || strpos($content, "\0") !== false) {
+                    return $findings;
+                }
+                $content .= stream_get_contents($handle);
+            } finally {
+                fclose($handle);
+            }
+
+            // PHP strings are raw bytes and none of the patterns use the /u
+            // modifier, so PCRE scans the file as read, with no decode pass.
             if ($checkCredentials) {
                 $credFindings = $this->checkCredentialsInText($content, $filePath);
                 $findings = array_merge($findings, $credFindings);
@@ -136,10 +245,24 @@ class SecurityValidator
             ];
         }
 
-        $this->findings = array_merge($this->findings, $findings);
         return $findings;
     }
 
+    /**
+     * Append findings and index them by severity
+     *
+     * @param array<int, array<string, mixed>> $findings Findings to record
+     */
+    private function recordFindings(array $findings): void
+    {
+        $position = count($this->findings);
+        foreach ($findings as $finding) {
+            $this->findings[$position] = $finding;
+            $this->severityIndex[$finding['severity'] ?? ''][] = $position;
+            $position++;
+        }
+    }
+
     /**
      * Check for hardcoded credentials in text
      *
@@ -151,16 +274,31 @@ class SecurityValidator
     {
         $findings = [];
 
-        foreach (self::CREDENTIAL_PATTERNS as [$pattern, $description]) {
+        // Most files mention none of the trigger words. A plain substring
+        // search over one lower-cased copy rules a keyword pattern out far
+        // more cheaply than running the regex engine over the file.
+        $lowerText = strtolower($text);
+
+        foreach (self::CREDENTIAL_PATTERNS as $rule) {
+            [$pattern, $description, $trigger] = $rule;
+            if ($trigger !== null && strpos($lowerText, $trigger) === false) {
+                continue;
+            }
             if (preg_match_all($pattern, $text, $matches, PREG_OFFSET_CAPTURE)) {
-                foreach ($matches[0] as $match) {
-                    $matchedValue = isset($matches[1]) && !empty($matches[1]) ? $matches[1][0][0] : $match[0];
+                // Matches arrive in ascending offset order, so the line number
+                // is advanced by counting only the newlines since the previous
+                // match rather than re-scanning (and copying) the whole prefix.
+                $line = 1;
+                $lineOffset = 0;
+                foreach ($matches[0] as $i => $match) {
+                    $matchedValue = isset($matches[1][$i]) ? $matches[1][$i][0] : $match[0];
                     
                     if ($this->isPlaceholder($matchedValue)) {
                         continue;
                     }
 
-                    $line = substr_count(substr($text, 0, $match[1]), "\n") + 1;
+                    $line += substr_count($text, "\n", $lineOffset, $match[1] - $lineOffset);
+                    $lineOffset = $match[1];
                     $snippet = substr($match[0], 0, 50);
 
                     $findings[] = [
@@ -189,27 +327,66 @@ class SecurityValidator
     {
         $findings = [];
 
-        foreach (self::DANGEROUS_FUNCTIONS as $funcName) {
-            $pattern = '/\b' . preg_quote($funcName, '/') . '\s*\(/';
-            if (preg_match_all($pattern, $text, $matches, PREG_OFFSET_CAPTURE)) {
-                foreach ($matches[0] as $match) {
-                    $line = substr_count(substr($text, 0, $match[1]), "\n") + 1;
+        // Every pattern ends in '(' and a single memchr rules them all out.
+        if (strpos($text, '(') === false) {
+            return [];
+        }
 
-                    $findings[] = [
-                        'severity' => 'medium',
-                        'type' => 'dangerous_function',
-                        'file' => $source,
-                        'function' => $funcName,
-                        'line' => $line,
-                        'message' => "Potentially dangerous function: {$funcName}"
-                    ];
-                }
+        // One pass over the text for every function name; matches are then
+        // bucketed per function so findings keep the DANGEROUS_FUNCTIONS order.
+        if (!preg_match_all(self::getDangerousFunctionPattern(), $text, $matches, PREG_OFFSET_CAPTURE)) {
+            return [];
+        }
+
+        $byFunction = array_fill_keys(self::DANGEROUS_FUNCTIONS, []);
+        foreach ($matches[0] as $i => $match) {
+            $byFunction[$matches[1][$i][0]][] = $match[1];
+        }
+
+        foreach ($byFunction as $funcName => $offsets) {
+            // Offsets are ascending within each bucket; advance the line count
+            // incrementally instead of re-scanning the prefix per match.
+            $line = 1;
+            $lineOffset = 0;
+            foreach ($offsets as $offset) {
+                $line += substr_count($text, "\n", $lineOffset, $offset - $lineOffset);
+                $lineOffset = $offset;
+
+                $findings[] = [
+                    'severity' => 'medium',
+                    'type' => 'dangerous_function',
+                    'file' => $source,
+                    'function' => $funcName,
+                    'line' => $line,
+                    'message' => "Potentially dangerous function: {$funcName}"
+                ];
             }
         }
 
         return $findings;
     }
 
+    /**
+     * Get a single regex matching any dangerous function call
+     *
+     * The alternation is derived from DANGEROUS_FUNCTIONS once per process,
+     * and capture group 1 holds the function name that matched. Scanning
+     * with it walks each file once instead of once per function.
+     *
+     * @return string Combined pattern
+     */
+    private static function getDangerousFunctionPattern(): string
+    {
+        if (self::$dangerousFunctionPattern === null) {
+            $alternatives = array_map(
+                static fn(string $funcName): string => preg_quote($funcName, '/'),
+                self::DANGEROUS_FUNCTIONS
+            );
+            self::$dangerousFunctionPattern = '/\b(' . implode('|', $alternatives) . ')\s*\(/';
+        }
+        return self::$dangerousFunctionPattern;
+    }
+
     /**
      * Check if a value looks like a placeholder
      *
@@ -218,19 +395,17 @@ class SecurityValidator
      */
     private function isPlaceholder(string $value): bool
     {
-        $placeholders = [
-            'your_', 'example', 'placeholder', 'xxx', 'test',
-            'dummy', 'sample', 'replace', 'changeme', 'todo'
-        ];
-        
-        $valueLower = strtolower($value);
-        foreach ($placeholders as $placeholder) {
-            if (strpos($valueLower, $placeholder) !== false) {
-                return true;
-            }
+        // The same sample values recur across files; remember each verdict.
+        if (isset(self::$placeholderCache[$value])) {
+            return self::$placeholderCache[$value];
         }
-        
-        return false;
+        if (count(self::$placeholderCache) >= self::PLACEHOLDER_CACHE_SIZE) {
+            self::$placeholderCache = [];
+        }
+
+        // One case-insensitive pass finds any placeholder token, instead of
+        // lower-casing the value and searching for each token in turn.
+        return self::$placeholderCache[$value] = preg_match(self::PLACEHOLDER_PATTERN, $value) === 1;
     }
 
     /**
@@ -255,7 +430,7 @@ class SecurityValidator
                 'permissions' => decoct($perms),
                 'message' => sprintf('File has overly permissive permissions: %o', $perms)
             ];
-            $this->findings[] = $finding;
+            $this->recordFindings([$finding]);
             return $finding;
         }
 
@@ -282,9 +457,11 @@ class SecurityValidator
     public function getFindings(?string $severity = null): array
     {
         if ($severity !== null) {
-            return array_filter($this->findings, function ($finding) use ($severity) {
-                return ($finding['severity'] ?? '') === $severity;
-            });
+            $filtered = [];
+            foreach ($this->severityIndex[$severity] ?? [] as $position) {
+                $filtered[$position] = $this->findings[$position];
+            }
+            return $filtered;
         }
         return $this->findings;
     }
@@ -296,12 +473,7 @@ class SecurityValidator
      */
     public function hasCriticalFindings(): bool
     {
-        foreach ($this->findings as $finding) {
-            if (in_array($finding['severity'] ?? '', ['critical', 'high'], true)) {
-                return true;
-            }
-        }
-        return false;
+        return isset($this->severityIndex['critical']) || isset($this->severityIndex['high']);
     }
 
     /**
@@ -309,49 +481,47 @@ class SecurityValidator
      */
     public function printReport(): void
     {
-        echo "\n" . str_repeat('=', 60) . "\n";
-        echo "Security Validation Report\n";
-        echo str_repeat('=', 60) . "\n";
+        // Assemble the whole report and write it once rather than issuing a
+        // separate echo for every line of every finding.
+        $rule = str_repeat('=', 60);
+        $lines = ['', $rule, 'Security Validation Report', $rule];
 
         if (empty($this->findings)) {
-            echo "\n✓ No security issues found!\n";
-            echo str_repeat('=', 60) . "\n\n";
+            $lines[] = '';
+            $lines[] = '✓ No security issues found!';
+            $lines[] = $rule;
+            echo implode("\n", $lines) . "\n\n";
             return;
         }
 
-        // Group by severity
-        $bySeverity = [];
-        foreach ($this->findings as $finding) {
-            $sev = $finding['severity'] ?? 'unknown';
-            if (!isset($bySeverity[$sev])) {
-                $bySeverity[$sev] = [];
-            }
-            $bySeverity[$sev][] = $finding;
-        }
-
-        // Print findings by severity
-        foreach (['critical', 'high', 'medium', 'low', 'warning'] as $sev) {
-            if (isset($bySeverity[$sev])) {
-                echo sprintf("\n%s Severity (%d findings):\n", strtoupper($sev), count($bySeverity[$sev]));
-                foreach ($bySeverity[$sev] as $finding) {
+        // Findings are already grouped by the severity index; walk it in
+        // report order instead of regrouping every finding.
+        foreach (self::REPORT_SEVERITIES as $sev) {
+            if (isset($this->severityIndex[$sev])) {
+                $lines[] = '';
+                $lines[] = sprintf('%s Severity (%d findings):', strtoupper($sev), count($this->severityIndex[$sev]));
+                foreach ($this->severityIndex[$sev] as $position) {
+                    $finding = $this->findings[$position];
                     $message = $finding['message'] ?? $finding['description'] ?? 'No description';
-                    echo "  - {$finding['type']}: {$message}\n";
+                    $lines[] = "  - {$finding['type']}: {$message}";
                     if (isset($finding['file'])) {
-                        echo "    File: {$finding['file']}\n";
+                        $lines[] = "    File: {$finding['file']}";
                     }
                     if (isset($finding['line'])) {
-                        echo "    Line: {$finding['line']}\n";
+                        $lines[] = "    Line: {$finding['line']}";
                     }
                 }
             }
         }
 
         $total = count($this->findings);
-        $critical = count($bySeverity['critical'] ?? []) + count($bySeverity['high'] ?? []);
+        $critical = count($this->severityIndex['critical'] ?? []) + count($this->severityIndex['high'] ?? []);
 
-        echo "\nTotal findings: {$total}\n";
-        echo "Critical/High: {$critical}\n";
-        echo str_repeat('=', 60) . "\n\n";
+        $lines[] = '';
+        $lines[] = "Total findings: {$total}";
+        $lines[] = "Critical/High: {$critical}";
+        $lines[] = $rule;
+        echo implode("\n", $lines) . "\n\n";
     }
 
     /**
@@ -360,15 +530,21 @@ class SecurityValidator
     public function clearFindings(): void
     {
         $this->findings = [];
+        $this->severityIndex = [];
     }
 
     /**
      * Scan a directory for security issues
      *
+     * Set $workers (or MOKO_SCAN_WORKERS) above 1 to scan files in forked
+     * worker processes; this needs the pcntl and posix extensions and falls
+     * back to a serial scan without them.
+     *
      * @param string $directory Directory to scan
      * @param array<int, string>|null $extensions File extensions to scan
+     * @param int|null $workers Number of worker processes (default: MOKO_SCAN_WORKERS or 1)
      */
-    public function scanDirectory(string $directory, ?array $extensions = null): void
+    public function scanDirectory(string $directory, ?array $extensions = null, ?int $workers = null): void
     {
         if ($extensions === null) {
             $extensions = ['.php', '.sh', '.yaml', '.yml', '.json', '.conf', '.cfg'];
@@ -378,21 +554,74 @@ class SecurityValidator
             return;
         }
 
+        // One walk of the tree, pruning directories that never hold project
+        // sources, with each file's suffix checked against a set.
         $iterator = new RecursiveIteratorIterator(
-            new RecursiveDirectoryIterator($directory)
+            new RecursiveCallbackFilterIterator(
+                new RecursiveDirectoryIterator($directory, RecursiveDirectoryIterator::SKIP_DOTS),
+                static fn(SplFileInfo $file): bool
+                    => !$file->isDir() || !isset(self::SKIPPED_DIRECTORIES[$file->getFilename()])
+            )
         );
+        $extensionSet = array_flip($extensions);
 
+        $paths = [];
         foreach ($iterator as $file) {
             if ($file->isFile()) {
-                $filePath = $file->getPathname();
-                foreach ($extensions as $ext) {
-                    if (substr($filePath, -strlen($ext)) === $ext) {
-                        $this->scanFile($filePath);
-                        break;
-                    }
+                $suffix = strrchr($file->getFilename(), '.');
+                if ($suffix !== false && isset($extensionSet[$suffix])) {
+                    $paths[] = $file->getPathname();
                 }
             }
         }
+
+        $workers ??= max(1, (int) (getenv('MOKO_SCAN_WORKERS') ?: 1));
+        if ($workers > 1 && count($paths) > 1 && ForkPool::isAvailable()) {
+            $this->scanFilesInWorkers($paths, $workers);
+            return;
+        }
+
+        foreach ($paths as $filePath) {
+            $this->scanFile($filePath);
+        }
+    }
+
+    /**
+     * Scan files across forked worker processes
+     *
+     * Each worker scans one contiguous chunk of $paths through ForkPool; the
+     * findings are merged in chunk order so the result matches a serial
+     * scan. Chunks whose worker did not report are scanned in the parent.
+     *
+     * @param array<int, string> $paths Files to scan
+     * @param int $workers Number of worker processes
+     */
+    private function scanFilesInWorkers(array $paths, int $workers): void
+    {
+        $chunks = array_chunk($paths, (int) ceil(count($paths) / $workers));
+        $chunkResults = ForkPool::map($chunks, fn(array $chunk): array => $this->collectChunkFindings($chunk));
+
+        $findings = [];
+        foreach ($chunks as $index => $chunk) {
+            $findings[] = $chunkResults[$index] ?? $this->collectChunkFindings($chunk);
+        }
+
+        $this->recordFindings(array_merge(...$findings));
+    }
+
+    /**
+     * Collect the findings of several files without recording them
+     *
+     * @param array<int, string> $paths Files to scan
+     * @return array<int, array<string, mixed>> Findings in file order
+     */
+    private function collectChunkFindings(array $paths): array
+    {
+        $findings = [];
+        foreach ($paths as $filePath) {
+            $findings[] = $this->collectFileFindings($filePath);
+        }
+        return array_merge(...$findings);
     }
 
     public function getVersion(): string
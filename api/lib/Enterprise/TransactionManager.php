@@ -46,8 +46,6 @@ declare(strict_types=1);
 
 namespace MokoEnterprise;
 
-use DateTime;
-use DateTimeZone;
 use Exception;
 
 /**
@@ -87,15 +85,29 @@ class Transaction
     private string $name;
     /** @var array<int, TransactionStep> */
     private array $steps = [];
+    /** @var array<int, TransactionStep> Executed steps that have a rollback function, in execution order */
+    private array $rollbackSteps = [];
     private bool $committed = false;
     private bool $rolledBack = false;
-    private ?DateTime $startTime = null;
-    private ?DateTime $endTime = null;
+    /** Wall-clock start and end as Unix timestamps, formatted only in getStatus() */
+    private int $startTime;
+    private ?int $endTime = null;
+    /** Monotonic start in nanoseconds (hrtime), used for the duration */
+    private int $startNs;
+    private bool $logSteps;
+    /** Number of steps run through executeUntracked() */
+    private int $untrackedCount = 0;
 
-    public function __construct(?string $name = null)
+    /**
+     * @param string|null $name Transaction name (default: txn_<UTC timestamp>)
+     * @param bool $logSteps Log every step start/completion; failures are always logged
+     */
+    public function __construct(?string $name = null, bool $logSteps = true)
     {
-        $this->name = $name ?? 'txn_' . date('Ymd_His');
-        $this->startTime = new DateTime('now', new DateTimeZone('UTC'));
+        $this->logSteps = $logSteps;
+        $this->startTime = time();
+        $this->startNs = hrtime(true);
+        $this->name = $name ?? 'txn_' . gmdate('Ymd_His', $this->startTime);
         error_log("Starting transaction: {$this->name}");
     }
 
@@ -114,12 +126,19 @@ class Transaction
         $step = new TransactionStep($name, $func, $rollbackFunc);
 
         try {
-            error_log("Executing step: {$name}");
+            if ($this->logSteps) {
+                error_log("Executing step: {$name}");
+            }
             $result = $func(...$args);
             $step->executed = true;
             $step->result = $result;
             $this->steps[] = $step;
-            error_log("Step completed: {$name}");
+            if ($rollbackFunc !== null) {
+                $this->rollbackSteps[] = $step;
+            }
+            if ($this->logSteps) {
+                error_log("Step completed: {$name}");
+            }
             return $result;
         } catch (Exception $e) {
             $step->error = $e->getMessage();
@@ -128,6 +147,31 @@ class Transaction
         }
     }
 
+    /**
+     * Execute a step that needs no rollback and no step record
+     *
+     * Failures are translated into TransactionError exactly as in execute(),
+     * but no TransactionStep is created or kept; only a count appears in
+     * getStatus(). Suited to read-only steps in high-volume batches.
+     *
+     * @param string $name Step name (used in the error message)
+     * @param callable $func Function to execute
+     * @param mixed ...$args Arguments for func
+     * @return mixed Result of func
+     * @throws TransactionError If step execution fails
+     */
+    public function executeUntracked(string $name, callable $func, ...$args)
+    {
+        try {
+            $result = $func(...$args);
+            $this->untrackedCount++;
+            return $result;
+        } catch (Exception $e) {
+            error_log("Step failed: {$name} - {$e->getMessage()}");
+            throw new TransactionError("Transaction step '{$name}' failed: {$e->getMessage()}", 0, $e);
+        }
+    }
+
     /**
      * Commit the transaction
      *
@@ -145,10 +189,10 @@ class Transaction
         }
 
         $this->committed = true;
-        $this->endTime = new DateTime('now', new DateTimeZone('UTC'));
-        
-        $duration = $this->endTime->getTimestamp() - $this->startTime->getTimestamp();
-        error_log("Transaction committed: {$this->name} (" . count($this->steps) . " steps, {$duration}s)");
+        $this->endTime = time();
+
+        $duration = (hrtime(true) - $this->startNs) / 1e9;
+        error_log(sprintf('Transaction committed: %s (%d steps, %.3fs)', $this->name, count($this->steps), $duration));
     }
 
     /**
@@ -163,15 +207,17 @@ class Transaction
 
         error_log("Rolling back transaction: {$this->name}");
 
-        // Rollback in reverse order
-        foreach (array_reverse($this->steps) as $step) {
-            if ($step->executed && $step->rollbackFunc !== null) {
-                try {
+        // Rollback in reverse order. Only steps with a rollback function are
+        // tracked, and indexing backwards avoids copying the list.
+        for ($i = count($this->rollbackSteps) - 1; $i >= 0; $i--) {
+            $step = $this->rollbackSteps[$i];
+            try {
+                if ($this->logSteps) {
                     error_log("Rolling back step: {$step->name}");
-                    ($step->rollbackFunc)();
-                } catch (Exception $e) {
-                    error_log("Rollback failed for step {$step->name}: {$e->getMessage()}");
                 }
+                ($step->rollbackFunc)();
+            } catch (Exception $e) {
+                error_log("Rollback failed for step {$step->name}: {$e->getMessage()}");
             }
         }
 
@@ -189,10 +235,11 @@ class Transaction
         return [
             'name' => $this->name,
             'steps_count' => count($this->steps),
+            'untracked_steps' => $this->untrackedCount,
             'committed' => $this->committed,
             'rolled_back' => $this->rolledBack,
-            'start_time' => $this->startTime?->format('c'),
-            'end_time' => $this->endTime?->format('c'),
+            'start_time' => gmdate('c', $this->startTime),
+            'end_time' => $this->endTime !== null ? gmdate('c', $this->endTime) : null,
             'steps' => array_map(function ($step) {
                 return [
                     'name' => $step->name,
@@ -246,26 +293,56 @@ class TransactionManager
 {
     private const VERSION = '04.00.04';
 
-    /** @var array<int, Transaction> */
+    /** @var array<int, Transaction> Most recent transactions, oldest first */
     private array $transactions = [];
     private ?Transaction $activeTransaction = null;
+    private int $historySize;
+    /** @var array{total: int, committed: int, rolled_back: int} Outcomes of transactions evicted from history */
+    private array $evictedStats = ['total' => 0, 'committed' => 0, 'rolled_back' => 0];
+
+    /**
+     * @param int $historySize Number of transactions kept for getHistory(); older ones are
+     *                         dropped (releasing their steps and closures) but still counted by getStats()
+     */
+    public function __construct(int $historySize = 1000)
+    {
+        $this->historySize = max(1, $historySize);
+    }
 
     /**
      * Begin a new transaction
      *
      * @param string|null $name Transaction name
+     * @param bool $logSteps Log every step start/completion; failures are always logged
      * @return Transaction New transaction instance
      * @throws TransactionError If another transaction is already active
      */
-    public function begin(?string $name = null): Transaction
+    public function begin(?string $name = null, bool $logSteps = true): Transaction
     {
         if ($this->activeTransaction !== null) {
             throw new TransactionError("Another transaction is already active");
         }
 
-        $txn = new Transaction($name);
+        $txn = new Transaction($name, $logSteps);
         $this->activeTransaction = $txn;
         $this->transactions[] = $txn;
+
+        // Keys keep increasing, so evicting the oldest entry is a single
+        // unset() rather than an array_shift() that renumbers the rest.
+        if (count($this->transactions) > $this->historySize) {
+            $oldestKey = array_key_first($this->transactions);
+            $oldest = $this->transactions[$oldestKey];
+            unset($this->transactions[$oldestKey]);
+
+            $this->evictedStats['total']++;
+            if ($oldest->isCommitted()) {
+                $this->evictedStats['committed']++;
+            }
+            if ($oldest->isRolledBack()) {
+                $this->evictedStats['rolled_back']++;
+            }
+        }
+
         return $txn;
     }
 
@@ -286,7 +363,7 @@ class TransactionManager
     {
         return array_map(function ($txn) {
             return $txn->getStatus();
-        }, $this->transactions);
+        }, array_values($this->transactions));
     }
 
     /**
@@ -296,8 +373,8 @@ class TransactionManager
      */
     public function getStats(): array
     {
-        $committed = 0;
-        $rolledBack = 0;
+        $committed = $this->evictedStats['committed'];
+        $rolledBack = $this->evictedStats['rolled_back'];
         
         foreach ($this->transactions as $txn) {
             if ($txn->isCommitted()) {
@@ -309,7 +386,7 @@ class TransactionManager
         }
 
         return [
-            'total' => count($this->transactions),
+            'total' => $this->evictedStats['total'] + count($this->transactions),
             'committed' => $committed,
             'rolled_back' => $rolledBack,
             'active' => $this->activeTransaction !== null ? 1 : 0
@@ -46,6 +46,7 @@ declare(strict_types=1);
 namespace MokoEnterprise;
 
 use Exception;
+use FilesystemIterator;
 use RecursiveDirectoryIterator;
 use RecursiveIteratorIterator;
 
@@ -74,6 +75,198 @@ class ValidationResult
     }
 }
 
+/**
+ * File lookups shared by all plugins during one validateAll() run
+ *
+ * Several plugins check and read overlapping paths. Stat results are kept
+ * for the whole run (a single stat() answers both "exists" and "size"), and
+ * file contents up to a fixed byte budget, so a path touched by more than
+ * one plugin costs one stat and one read. The cache lives only as long as
+ * the run, so later edits to the tree are always seen.
+ */
+class ValidationRunCache
+{
+    /** Total bytes of file contents kept before further reads go uncached */
+    private const CONTENT_BUDGET = 8 * 1024 * 1024;
+
+    /** @var array<string, array<string, int>|false> stat() results, false when missing */
+    private array $stats = [];
+    /** @var array<string, string|false> File contents, false when unreadable */
+    private array $contents = [];
+    private int $contentBytes = 0;
+    /** @var array<string, DirectoryIndex> Indexes keyed by root and recursion flag */
+    private array $indexes = [];
+    /** @var array<string, array<string, true>|null> Directory entry sets, null when unreadable */
+    private array $listings = [];
+    /** @var array<string, bool> lstat()-based existence, which does not follow symlinks */
+    private array $lexists = [];
+
+    /**
+     * @return array<string, int>|false stat() result, or false if the path does not exist
+     */
+    private function stat(string $path): array|false
+    {
+        if (!array_key_exists($path, $this->stats)) {
+            $this->stats[$path] = @stat($path);
+        }
+        return $this->stats[$path];
+    }
+
+    /**
+     * Whether the path exists (file or directory)
+     */
+    public function exists(string $path): bool
+    {
+        return $this->stat($path) !== false;
+    }
+
+    /**
+     * Whether a directory entry exists at the path, without following symlinks
+     *
+     * Unlike exists(), a dangling symlink counts as present, which matches
+     * what a directory listing reports.
+     */
+    public function lexists(string $path): bool
+    {
+        return $this->lexists[$path] ??= @lstat($path) !== false;
+    }
+
+    /**
+     * File size in bytes, or null if the path does not exist
+     */
+    public function size(string $path): ?int
+    {
+        $stat = $this->stat($path);
+        return $stat !== false ? $stat['size'] : null;
+    }
+
+    /**
+     * Content of a file, or null if it is missing or cannot be read
+     *
+     * @param string $path File path
+     * @param int|null $maxBytes Return at most this many leading bytes; a
+     *                           file larger than this is read only that far
+     */
+    public function contents(string $path, ?int $maxBytes = null): ?string
+    {
+        if (array_key_exists($path, $this->contents)) {
+            $content = $this->contents[$path];
+            if ($content === false) {
+                return null;
+            }
+            return $maxBytes !== null && strlen($content) > $maxBytes ? substr($content, 0, $maxBytes) : $content;
+        }
+        $stat = $this->stat($path);
+        if ($stat === false) {
+            return null;
+        }
+        // The stat is already cached, so an empty regular file needs no
+        // open/read at all.
+        if ($stat['size'] === 0 && ($stat['mode'] & 0170000) === 0100000) {
+            return $this->contents[$path] = '';
+        }
+        if ($maxBytes !== null && $stat['size'] > $maxBytes) {
+            $head = @file_get_contents($path, false, null, 0, $maxBytes);
+            return $head !== false ? $head : null;
+        }
+
+        $content = @file_get_contents($path);
+        if ($content === false || $this->contentBytes + strlen($content) <= self::CONTENT_BUDGET) {
+            $this->contents[$path] = $content;
+            $this->contentBytes += $content === false ? 0 : strlen($content);
+        }
+        return $content !== false ? $content : null;
+    }
+
+    /**
+     * Names of the entries directly inside a directory
+     *
+     * @param string $dir Directory to list
+     * @return array<string, true>|null Entry names as keys, or null if the directory cannot be read
+     */
+    public function listing(string $dir): ?array
+    {
+        if (!array_key_exists($dir, $this->listings)) {
+            $entries = @scandir($dir, SCANDIR_SORT_NONE);
+            $this->listings[$dir] = $entries === false ? null : array_fill_keys($entries, true);
+        }
+        return $this->listings[$dir];
+    }
+
+    /**
+     * Files under a directory grouped by extension, listed once per run
+     *
+     * @param string $root Directory to list
+     * @param bool $recursive Include subdirectories
+     */
+    public function directoryIndex(string $root, bool $recursive = true): DirectoryIndex
+    {
+        $key = ($recursive ? 'r:' : 'f:') . $root;
+        return $this->indexes[$key] ??= new DirectoryIndex($root, $recursive);
+    }
+
+    /**
+     * Drop everything cached so far
+     */
+    public function clear(): void
+    {
+        $this->stats = [];
+        $this->contents = [];
+        $this->contentBytes = 0;
+        $this->indexes = [];
+        $this->listings = [];
+        $this->lexists = [];
+    }
+}
+
+/**
+ * Files below a directory, grouped by extension
+ *
+ * Built with a single directory walk so that plugins looking for different
+ * file types do not each enumerate the same tree.
+ */
+class DirectoryIndex
+{
+    /** @var array<string, array<int, string>> Sorted paths keyed by extension (without the dot) */
+    private array $byExtension = [];
+
+    /**
+     * @param string $root Directory to list
+     * @param bool $recursive Include subdirectories
+     * @throws \UnexpectedValueException If the directory cannot be opened
+     */
+    public function __construct(string $root, bool $recursive = true)
+    {
+        $iterator = $recursive
+            ? new RecursiveIteratorIterator(
+                new RecursiveDirectoryIterator($root, RecursiveDirectoryIterator::SKIP_DOTS)
+            )
+            : new FilesystemIterator($root);
+
+        foreach ($iterator as $file) {
+            if ($file->isFile()) {
+                $this->byExtension[$file->getExtension()][] = $file->getPathname();
+            }
+        }
+
+        foreach ($this->byExtension as &$paths) {
+            sort($paths, SORT_STRING);
+        }
+        unset($paths);
+    }
+
+    /**
+     * Files with the given extension
+     *
+     * @param string $extension Extension without the dot, e.g. 'php'
+     * @return array<int, string> File paths in sorted order
+     */
+    public function byExtension(string $extension): array
+    {
+        return $this->byExtension[$extension] ?? [];
+    }
+}
+
 /**
  * Abstract base class for validation plugins
  */
@@ -114,6 +307,89 @@ abstract class ValidationPlugin
     {
         return $this->name;
     }
+
+    /**
+     * File cache for the current run
+     *
+     * validateAll() puts one in $context['_cache']; a plugin run on its own
+     * gets a fresh one.
+     *
+     * @param array<string, mixed> $context Validation context
+     */
+    protected function runCache(array $context): ValidationRunCache
+    {
+        return $context['_cache'] ?? new ValidationRunCache();
+    }
+}
+
+/**
+ * Base class for plugins that inspect file contents
+ *
+ * Instead of reading files itself, a visitor names the files it wants and
+ * is handed each one's content. UnifiedValidator::validateAll() walks the
+ * files of all visitors together, so a file requested by several plugins
+ * is read once rather than once per plugin.
+ */
+abstract class FileVisitorPlugin extends ValidationPlugin
+{
+    /**
+     * Files this plugin wants to inspect
+     *
+     * @param array<string, mixed> $context Validation context
+     * @return array<int, string> File paths; missing or unreadable files are skipped
+     */
+    abstract public function filesToVisit(array $context): array;
+
+    /**
+     * Reset per-run state before any file is visited
+     *
+     * @param array<string, mixed> $context Validation context
+     */
+    abstract public function beginVisit(array $context): void;
+
+    /**
+     * Inspect the content of one file
+     *
+     * @param string $filePath Path as returned by filesToVisit()
+     * @param string $content File content
+     */
+    abstract public function visitFile(string $filePath, string $content): void;
+
+    /**
+     * Build the result once every file has been visited
+     *
+     * @param array<string, mixed> $context Validation context
+     * @return ValidationResult Result indicating pass/fail with details
+     */
+    abstract public function endVisit(array $context): ValidationResult;
+
+    /**
+     * Leading bytes of each file this plugin needs, or null for all of it
+     *
+     * A file is read only as far as the most demanding interested plugin
+     * requires.
+     */
+    public function maxBytesToVisit(): ?int
+    {
+        return null;
+    }
+
+    /**
+     * Run this plugin on its own, reading its files directly
+     */
+    public function validate(array $context): ValidationResult
+    {
+        $cache = $this->runCache($context);
+        $this->beginVisit($context);
+        foreach ($this->filesToVisit($context) as $filePath) {
+            $content = $cache->contents($filePath, $this->maxBytesToVisit());
+            if ($content === null) {
+                continue;
+            }
+            $this->visitFile($filePath, $content);
+        }
+        return $this->endVisit($context);
+    }
 }
 
 /**
@@ -121,6 +397,9 @@ abstract class ValidationPlugin
  */
 class PathValidatorPlugin extends ValidationPlugin
 {
+    /** Paths sharing a parent from which one directory listing beats a stat per path */
+    private const LISTING_THRESHOLD = 8;
+
     public function __construct()
     {
         parent::__construct('path_validator');
@@ -134,9 +413,23 @@ class PathValidatorPlugin extends ValidationPlugin
             return new ValidationResult($this->name, true, 'No paths to validate');
         }
 
+        $cache = $this->runCache($context);
+        // A path is valid when a directory entry exists for it; symlinks are
+        // not followed, so a dangling link counts as present. Where many
+        // paths share a parent, one listing of that directory answers them
+        // all. A name missing from the listing still gets an lstat, so
+        // case-insensitive filesystems resolve the same either way.
+        $parentCounts = array_count_values(array_map('dirname', $paths));
         $invalidPaths = [];
         foreach ($paths as $path) {
-            if (!file_exists($path)) {
+            $parent = dirname($path);
+            $name = basename($path);
+            if ($parentCounts[$parent] >= self::LISTING_THRESHOLD
+                && $name !== '' && $name !== '.' && $name !== '..'
+                && isset($cache->listing($parent)[$name])) {
+                continue;
+            }
+            if (!$cache->lexists($path)) {
                 $invalidPaths[] = $path;
             }
         }
@@ -157,14 +450,38 @@ class PathValidatorPlugin extends ValidationPlugin
 /**
  * Validates Markdown files
  */
-class MarkdownValidatorPlugin extends ValidationPlugin
+class MarkdownValidatorPlugin extends FileVisitorPlugin
 {
+    /** Link targets starting with 404 or broken, matched in a single scan */
+    private const BROKEN_LINK_PATTERN = '/\]\((?:404|broken)/';
+
+    /** @var array<int, string> */
+    private array $issues = [];
+
     public function __construct()
     {
         parent::__construct('markdown_validator');
     }
 
-    public function validate(array $context): ValidationResult
+    public function filesToVisit(array $context): array
+    {
+        return $context['markdown_files'] ?? [];
+    }
+
+    public function beginVisit(array $context): void
+    {
+        $this->issues = [];
+    }
+
+    public function visitFile(string $filePath, string $content): void
+    {
+        // Check for broken links
+        if (preg_match(self::BROKEN_LINK_PATTERN, $content) === 1) {
+            $this->issues[] = "{$filePath}: Potential broken links";
+        }
+    }
+
+    public function endVisit(array $context): ValidationResult
     {
         $files = $context['markdown_files'] ?? [];
         
@@ -172,26 +489,12 @@ class MarkdownValidatorPlugin extends ValidationPlugin
             return new ValidationResult($this->name, true, 'No Markdown files to validate');
         }
 
-        $issues = [];
-        foreach ($files as $filePath) {
-            if (!file_exists($filePath)) {
-                continue;
-            }
-
-            $content = file_get_contents($filePath);
-            
-            // Check for broken links
-            if (strpos($content, '](404') !== false || strpos($content, '](broken') !== false) {
-                $issues[] = "{$filePath}: Potential broken links";
-            }
-        }
-
-        if (!empty($issues)) {
+        if (!empty($this->issues)) {
             return new ValidationResult(
                 $this->name,
                 false,
-                sprintf('Found %d issues', count($issues)),
-                ['issues' => $issues]
+                sprintf('Found %d issues', count($this->issues)),
+                ['issues' => $this->issues]
             );
         }
 
@@ -201,15 +504,53 @@ class MarkdownValidatorPlugin extends ValidationPlugin
 
 /**
  * Validates license headers
+ *
+ * The copyright notice is expected in the file header, so only the first
+ * $headerBytes of each file are read and checked.
  */
-class LicenseValidatorPlugin extends ValidationPlugin
+class LicenseValidatorPlugin extends FileVisitorPlugin
 {
-    public function __construct()
+    /** Default number of leading bytes searched for the copyright notice */
+    public const HEADER_BYTES = 4096;
+
+    /** @var array<int, string> */
+    private array $missingLicense = [];
+    private string $expectedCopyright = '2026';
+    private int $headerBytes;
+
+    /**
+     * @param int $headerBytes Leading bytes of each file searched for the notice
+     */
+    public function __construct(int $headerBytes = self::HEADER_BYTES)
     {
         parent::__construct('license_validator');
+        $this->headerBytes = max(1, $headerBytes);
     }
 
-    public function validate(array $context): ValidationResult
+    public function maxBytesToVisit(): ?int
+    {
+        return $this->headerBytes;
+    }
+
+    public function filesToVisit(array $context): array
+    {
+        return $context['source_files'] ?? [];
+    }
+
+    public function beginVisit(array $context): void
+    {
+        $this->missingLicense = [];
+        $this->expectedCopyright = (string) ($context['copyright_year'] ?? '2026');
+    }
+
+    public function visitFile(string $filePath, string $content): void
+    {
+        if (strpos($content, 'Copyright') === false || strpos($content, $this->expectedCopyright) === false) {
+            $this->missingLicense[] = $filePath;
+        }
+    }
+
+    public function endVisit(array $context): ValidationResult
     {
         $files = $context['source_files'] ?? [];
         
@@ -217,30 +558,12 @@ class LicenseValidatorPlugin extends ValidationPlugin
             return new ValidationResult($this->name, true, 'No source files to validate');
         }
 
-        $missingLicense = [];
-        $expectedCopyright = $context['copyright_year'] ?? '2026';
-
-        foreach ($files as $filePath) {
-            if (!file_exists($filePath)) {
-                continue;
-            }
-
-            try {
-                $content = file_get_contents($filePath);
-                if (strpos($content, 'Copyright') === false || strpos($content, $expectedCopyright) === false) {
-                    $missingLicense[] = $filePath;
-                }
-            } catch (Exception $e) {
-                // Skip files that can't be read
-            }
-        }
-
-        if (!empty($missingLicense)) {
+        if (!empty($this->missingLicense)) {
             return new ValidationResult(
                 $this->name,
                 false,
-                sprintf('%d files missing proper license headers', count($missingLicense)),
-                ['files' => $missingLicense]
+                sprintf('%d files missing proper license headers', count($this->missingLicense)),
+                ['files' => $this->missingLicense]
             );
         }
 
@@ -253,6 +576,9 @@ class LicenseValidatorPlugin extends ValidationPlugin
  */
 class WorkflowValidatorPlugin extends ValidationPlugin
 {
+    /** 'on:' or 'on :', matched in a single scan */
+    private const TRIGGER_PATTERN = '/on ?:/';
+
     public function __construct()
     {
         parent::__construct('workflow_validator');
@@ -266,10 +592,9 @@ class WorkflowValidatorPlugin extends ValidationPlugin
             return new ValidationResult($this->name, true, 'No workflows directory');
         }
 
-        $workflows = array_merge(
-            glob($workflowDir . '/*.yml') ?: [],
-            glob($workflowDir . '/*.yaml') ?: []
-        );
+        $cache = $this->runCache($context);
+        $index = $cache->directoryIndex($workflowDir, false);
+        $workflows = array_merge($index->byExtension('yml'), $index->byExtension('yaml'));
 
         if (empty($workflows)) {
             return new ValidationResult($this->name, true, 'No workflow files found');
@@ -277,10 +602,10 @@ class WorkflowValidatorPlugin extends ValidationPlugin
 
         $issues = [];
         foreach ($workflows as $workflow) {
-            $content = file_get_contents($workflow);
+            $content = (string) $cache->contents($workflow);
             
             // Basic checks
-            if (strpos($content, 'on:') === false && strpos($content, 'on :') === false) {
+            if (preg_match(self::TRIGGER_PATTERN, $content) !== 1) {
                 $issues[] = basename($workflow) . ": Missing 'on:' trigger";
             }
         }
@@ -319,14 +644,8 @@ class SecurityValidatorPlugin extends ValidationPlugin
         try {
             $validator = new SecurityValidator();
 
-            $iterator = new RecursiveIteratorIterator(
-                new RecursiveDirectoryIterator($scanDir)
-            );
-
-            foreach ($iterator as $file) {
-                if ($file->isFile() && $file->getExtension() === 'php') {
-                    $validator->scanFile($file->getPathname());
-                }
+            foreach ($this->runCache($context)->directoryIndex($scanDir)->byExtension('php') as $filePath) {
+                $validator->scanFile($filePath);
             }
 
             $findings = $validator->getFindings();
@@ -405,36 +724,200 @@ class UnifiedValidator
     /**
      * Run all enabled validation plugins
      *
+     * File visitor plugins share one pass over their files. The remaining
+     * plugins are independent; set $workers (or MOKO_VALIDATION_WORKERS)
+     * above 1 to run them in forked worker processes. This needs the pcntl
+     * and posix extensions and falls back to running them in turn.
+     *
      * @param array<string, mixed> $context Validation context data
+     * @param int|null $workers Number of worker processes (default: MOKO_VALIDATION_WORKERS or 1)
      * @return array<int, ValidationResult> List of validation results
      */
-    public function validateAll(array $context = []): array
+    public function validateAll(array $context = [], ?int $workers = null): array
     {
         $this->results = [];
+        $cache = new ValidationRunCache();
+        $context['_cache'] = $cache;
 
         error_log("Running " . count($this->plugins) . " validation plugins...");
 
+        $enabled = [];
         foreach ($this->plugins as $pluginName => $plugin) {
             if (!$plugin->isEnabled()) {
                 error_log("Skipping disabled plugin: {$pluginName}");
                 continue;
             }
+            $enabled[$pluginName] = $plugin;
+        }
+
+        $visitors = array_filter($enabled, fn($p) => $p instanceof FileVisitorPlugin);
+        $results = $this->runFileVisitors($visitors, $context);
+
+        $others = array_diff_key($enabled, $visitors);
+        $workers ??= max(1, (int) (getenv('MOKO_VALIDATION_WORKERS') ?: 1));
+        if ($workers > 1 && count($others) > 1 && ForkPool::isAvailable()) {
+            $results += $this->runPluginsInWorkers($others, $context, $workers);
+        } else {
+            foreach ($others as $pluginName => $plugin) {
+                $results[$pluginName] = $this->runPlugin($pluginName, $plugin, $context);
+            }
+        }
 
+        // Results keep plugin registration order whichever way they ran
+        foreach ($enabled as $pluginName => $plugin) {
+            $this->results[] = $results[$pluginName];
+        }
+
+        $cache->clear();
+
+        return $this->results;
+    }
+
+    /**
+     * Run one plugin, turning an exception into a failed result
+     *
+     * @param string $pluginName Plugin name
+     * @param ValidationPlugin $plugin Plugin instance
+     * @param array<string, mixed> $context Validation context data
+     * @return ValidationResult Plugin result
+     */
+    private function runPlugin(string $pluginName, ValidationPlugin $plugin, array $context): ValidationResult
+    {
+        try {
+            error_log("Running plugin: {$pluginName}");
+            return $plugin->validate($context);
+        } catch (Exception $e) {
+            return $this->pluginFailure($pluginName, $e);
+        }
+    }
+
+    /**
+     * Run plugins across forked worker processes
+     *
+     * Each worker runs one contiguous chunk of plugins through ForkPool and
+     * reports plain [passed, message, details] rows. Chunks whose worker did
+     * not report are run in the parent.
+     *
+     * @param array<string, ValidationPlugin> $plugins Plugins to run
+     * @param array<string, mixed> $context Validation context data
+     * @param int $workers Number of worker processes
+     * @return array<string, ValidationResult> Results keyed by plugin name
+     */
+    private function runPluginsInWorkers(array $plugins, array $context, int $workers): array
+    {
+        $chunks = array_chunk($plugins, (int) ceil(count($plugins) / $workers), true);
+        $chunkRows = ForkPool::map($chunks, function (array $chunk) use ($context): array {
+            $rows = [];
+            foreach ($chunk as $pluginName => $plugin) {
+                $result = $this->runPlugin($pluginName, $plugin, $context);
+                $rows[$pluginName] = [$result->passed, $result->message, $result->details];
+            }
+            return $rows;
+        });
+
+        $results = [];
+        foreach ($chunks as $index => $chunk) {
+            $rows = $chunkRows[$index];
+            foreach ($chunk as $pluginName => $plugin) {
+                $results[$pluginName] = isset($rows[$pluginName])
+                    ? new ValidationResult($pluginName, ...$rows[$pluginName])
+                    : $this->runPlugin($pluginName, $plugin, $context);
+            }
+        }
+
+        return $results;
+    }
+
+    /**
+     * Run file visitor plugins over their files in a single pass
+     *
+     * Each file is read once, however many plugins asked for it, and its
+     * content handed to every one of them. A plugin that throws gets an
+     * error result and receives no further files.
+     *
+     * @param array<string, FileVisitorPlugin> $visitors Enabled visitor plugins
+     * @param array<string, mixed> $context Validation context data
+     * @return array<string, ValidationResult> Results keyed by plugin name
+     */
+    private function runFileVisitors(array $visitors, array $context): array
+    {
+        $results = [];
+        /** @var array<string, array<int, string>> $interested File path => plugin names */
+        $interested = [];
+        /** @var array<string, int|null> $limits File path => bytes needed, null for the whole file */
+        $limits = [];
+
+        foreach ($visitors as $pluginName => $plugin) {
             try {
                 error_log("Running plugin: {$pluginName}");
-                $result = $plugin->validate($context);
-                $this->results[] = $result;
+                $plugin->beginVisit($context);
+                $limit = $plugin->maxBytesToVisit();
+                foreach ($plugin->filesToVisit($context) as $filePath) {
+                    $interested[$filePath][] = $pluginName;
+                    if (!array_key_exists($filePath, $limits)) {
+                        $limits[$filePath] = $limit;
+                    } elseif ($limits[$filePath] !== null) {
+                        $limits[$filePath] = $limit === null ? null : max($limits[$filePath], $limit);
+                    }
+                }
             } catch (Exception $e) {
-                error_log("Plugin {$pluginName} failed: {$e->getMessage()}");
-                $this->results[] = new ValidationResult(
-                    $pluginName,
-                    false,
-                    "Plugin error: {$e->getMessage()}"
-                );
+                $results[$pluginName] = $this->pluginFailure($pluginName, $e);
             }
         }
 
-        return $this->results;
+        foreach ($interested as $filePath => $pluginNames) {
+            // Numeric file names come back from the array as int keys
+            $filePath = (string) $filePath;
+            $content = $context['_cache']->contents($filePath, $limits[$filePath]);
+            if ($content === null) {
+                continue;
+            }
+
+            foreach ($pluginNames as $pluginName) {
+                if (isset($results[$pluginName])) {
+                    continue;
+                }
+                $limit = $visitors[$pluginName]->maxBytesToVisit();
+                try {
+                    $visitors[$pluginName]->visitFile(
+                        $filePath,
+                        $limit !== null && strlen($content) > $limit ? substr($content, 0, $limit) : $content
+                    );
+                } catch (Exception $e) {
+                    $results[$pluginName] = $this->pluginFailure($pluginName, $e);
+                }
+            }
+        }
+
+        foreach ($visitors as $pluginName => $plugin) {
+            if (isset($results[$pluginName])) {
+                continue;
+            }
+            try {
+                $results[$pluginName] = $plugin->endVisit($context);
+            } catch (Exception $e) {
+                $results[$pluginName] = $this->pluginFailure($pluginName, $e);
+            }
+        }
+
+        return $results;
+    }
+
+    /**
+     * Log a plugin exception and turn it into a failed result
+     *
+     * @param string $pluginName Name of the failing plugin
+     * @param Exception $e Exception it raised
+     * @return ValidationResult Failed result carrying the error message
+     */
+    private function pluginFailure(string $pluginName, Exception $e): ValidationResult
+    {
+        error_log("Plugin {$pluginName} failed: {$e->getMessage()}");
+        return new ValidationResult(
+            $pluginName,
+            false,
+            "Plugin error: {$e->getMessage()}"
+        );
     }
 
     /**
@@ -21,16 +21,29 @@ declare(strict_types=1);
 
 require_once __DIR__ . '/../../vendor/autoload.php';
 
-use MokoEnterprise\CliFramework;
+use MokoEnterprise\{ApiClient, ClientRequestError, CliFramework, Config};
 
 /**
  * Deploys the standard set of GitHub repository labels required by MokoStandards.
  *
- * Uses the GitHub CLI (`gh`) to create or update each label.
+ * Uses the GitHub CLI (`gh`) to resolve the repository and credentials, then
+ * creates or updates each label over the REST API.
  * Supports --dry-run mode to preview without making changes.
  */
 class SetupLabels extends CliFramework
 {
+	/**
+	 * Labels already present on the repository, keyed by lower-cased name.
+	 *
+	 * @var array<string, array{name: string, color: string, description: string}>
+	 */
+	private array $existingLabels = [];
+
+	/**
+	 * REST client shared by every label write (null falls back to `gh label create`).
+	 */
+	private ?ApiClient $api = null;
+
 	/**
 	 * Label definitions — [name, hexColor (no #), description].
 	 *
@@ -137,17 +150,26 @@ class SetupLabels extends CliFramework
 		$repo = trim((string) shell_exec('gh repo view --json nameWithOwner -q .nameWithOwner 2>/dev/null'));
 		$this->log('INFO', "Setting up labels for repository: {$repo}");
 
+		if (!$dryRun && $repo !== '') {
+			$this->existingLabels = $this->fetchExistingLabels($repo);
+
+			$token = Config::load()->getString('github.token', '');
+			if ($token !== '') {
+				$this->api = new ApiClient('https://api.github.com', $token, enableCaching: false);
+			}
+		}
+
 		echo "\n";
 
-		$this->deployGroup('Creating REQUIRED project type labels...',   0,  2, $dryRun);
-		$this->deployGroup('Creating REQUIRED language labels...',       3,  8, $dryRun);
-		$this->deployGroup('Creating REQUIRED component labels...',      9, 16, $dryRun);
-		$this->deployGroup('Creating REQUIRED workflow labels...',      17, 21, $dryRun);
-		$this->deployGroup('Creating REQUIRED priority labels...',      22, 25, $dryRun);
-		$this->deployGroup('Creating REQUIRED type labels...',          26, 30, $dryRun);
-		$this->deployGroup('Creating REQUIRED status labels...',        31, 35, $dryRun);
-		$this->deployGroup('Creating REQUIRED size labels...',          36, 41, $dryRun);
-		$this->deployGroup('Creating REQUIRED health labels...',        42, 45, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED project type labels...',   0,  2, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED language labels...',       3,  8, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED component labels...',      9, 16, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED workflow labels...',      17, 21, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED priority labels...',      22, 25, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED type labels...',          26, 30, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED status labels...',        31, 35, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED size labels...',          36, 41, $dryRun);
+		$this->deployGroup($repo, 'Creating REQUIRED health labels...',        42, 45, $dryRun);
 
 		echo "\n============================================================\n";
 		if ($dryRun) {
@@ -166,51 +188,146 @@ class SetupLabels extends CliFramework
 	/**
 	 * Deploy a named group of labels by index range in self::LABELS.
 	 *
+	 * @param string $repo       Repository in owner/name form.
 	 * @param string $heading    Informational banner printed before the group.
 	 * @param int    $fromIndex  First label index (inclusive).
 	 * @param int    $toIndex    Last label index (inclusive).
 	 * @param bool   $dryRun     When true, preview only.
 	 */
-	private function deployGroup(string $heading, int $fromIndex, int $toIndex, bool $dryRun): void
+	private function deployGroup(string $repo, string $heading, int $fromIndex, int $toIndex, bool $dryRun): void
 	{
 		$this->log('INFO', $heading);
 		for ($i = $fromIndex; $i <= $toIndex; $i++) {
 			[$name, $color, $desc] = self::LABELS[$i];
-			$this->createLabel($name, $color, $desc, $dryRun);
+			$this->createLabel($repo, $name, $color, $desc, $dryRun);
 		}
 		echo "\n";
 	}
 
+	/**
+	 * Fetch the repository's current labels with a single paginated gh call.
+	 *
+	 * One `gh api --paginate` process streams every page, letting createLabel()
+	 * skip labels that are already up to date instead of spawning a
+	 * `gh label create` process for each of them.
+	 *
+	 * @param string $repo  Repository in owner/name form.
+	 * @return array<string, array{name: string, color: string, description: string}>
+	 */
+	private function fetchExistingLabels(string $repo): array
+	{
+		$cmd = 'gh api --paginate '
+			. escapeshellarg("repos/{$repo}/labels?per_page=100")
+			. ' --jq ' . escapeshellarg('.[] | {name, color, description}')
+			. ' 2>/dev/null';
+
+		$labels = [];
+		foreach (explode("\n", (string) shell_exec($cmd)) as $line) {
+			$label = json_decode($line, true);
+			if (!is_array($label) || !isset($label['name'])) {
+				continue;
+			}
+			$labels[strtolower($label['name'])] = [
+				'name'        => (string) $label['name'],
+				'color'       => strtolower((string) ($label['color'] ?? '')),
+				'description' => (string) ($label['description'] ?? ''),
+			];
+		}
+
+		return $labels;
+	}
+
 	/**
 	 * Create or update a single GitHub label.
 	 *
+	 * Writes go straight to the REST API over one keep-alive connection;
+	 * spawning `gh label create` per label costs a process start and a TLS
+	 * handshake each time, and is only used when no token could be resolved.
+	 *
+	 * @param string $repo   Repository in owner/name form.
 	 * @param string $name   Label name.
 	 * @param string $color  Hex colour without the leading '#'.
 	 * @param string $desc   Short description text.
 	 * @param bool   $dryRun When true, preview only.
 	 */
-	private function createLabel(string $name, string $color, string $desc, bool $dryRun): void
+	private function createLabel(string $repo, string $name, string $color, string $desc, bool $dryRun): void
 	{
 		if ($dryRun) {
 			echo "[DRY-RUN] Would create label: {$name} (color: #{$color}, description: {$desc})\n";
 			return;
 		}
 
-		$cmd = 'gh label create '
-			. escapeshellarg($name)
-			. ' --color ' . escapeshellarg($color)
-			. ' --description ' . escapeshellarg($desc)
-			. ' --force 2>/dev/null';
+		$existing = $this->existingLabels[strtolower($name)] ?? null;
+		if ($existing !== null
+			&& $existing['name'] === $name
+			&& $existing['color'] === strtolower($color)
+			&& $existing['description'] === $desc
+		) {
+			$this->log('INFO', "Label already up to date: {$name}");
+			return;
+		}
+
+		if ($this->api !== null) {
+			$ok = $this->writeLabel($repo, $existing['name'] ?? null, $name, $color, $desc);
+		} else {
+			$cmd = 'gh label create '
+				. escapeshellarg($name)
+				. ' --color ' . escapeshellarg($color)
+				. ' --description ' . escapeshellarg($desc)
+				. ' --force 2>/dev/null';
 
-		exec($cmd, $out, $code);
-		unset($out);
+			exec($cmd, $out, $code);
+			unset($out);
+			$ok = $code === 0;
+		}
 
-		if ($code === 0) {
+		if ($ok) {
 			$this->log('INFO', "Created/updated label: {$name}");
 		} else {
 			$this->log('WARNING', "Failed to create label: {$name}");
 		}
 	}
+
+	/**
+	 * Create a label, or update it in place when it already exists.
+	 *
+	 * @param string      $repo     Repository in owner/name form.
+	 * @param string|null $current  Current name of an existing label, or null to create.
+	 * @param string      $name     Label name.
+	 * @param string      $color    Hex colour without the leading '#'.
+	 * @param string      $desc     Short description text.
+	 * @return bool  True on success.
+	 */
+	private function writeLabel(string $repo, ?string $current, string $name, string $color, string $desc): bool
+	{
+		try {
+			if ($current === null) {
+				try {
+					$this->api->post("/repos/{$repo}/labels", [
+						'name'        => $name,
+						'color'       => $color,
+						'description' => $desc,
+					]);
+					return true;
+				} catch (ClientRequestError $e) {
+					// 422: the label exists after all (e.g. the prefetch failed).
+					if ($e->getCode() !== 422) {
+						return false;
+					}
+					$current = $name;
+				}
+			}
+
+			$this->api->patch("/repos/{$repo}/labels/" . rawurlencode($current), [
+				'new_name'    => $name,
+				'color'       => $color,
+				'description' => $desc,
+			]);
+			return true;
+		} catch (\Throwable $e) {
+			return false;
+		}
+	}
 }
 
 $script = new SetupLabels('setup_labels', 'REQUIRED: Deploy standard labels to repository');
@@ -0,0 +1,95 @@
+<?php
+
+declare(strict_types=1);
+
+/**
+ * Tests for PathValidatorPlugin
+ *
+ * Copyright (C) 2026 Moko Consulting <hello@mokoconsulting.tech>
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ *
+ * @package MokoStandards\Tests
+ * @license GPL-3.0-or-later
+ */
+
+namespace MokoStandards\Tests\Enterprise;
+
+use MokoEnterprise\PathValidatorPlugin;
+use PHPUnit\Framework\Attributes\DataProvider;
+use PHPUnit\Framework\TestCase;
+
+// UnifiedValidation.php declares several classes, so PSR-4 cannot find them
+require_once __DIR__ . '/../../lib/Enterprise/UnifiedValidation.php';
+
+final class PathValidatorPluginTest extends TestCase
+{
+    private string $dir;
+
+    protected function setUp(): void
+    {
+        $this->dir = sys_get_temp_dir() . '/moko_path_validator_' . bin2hex(random_bytes(4));
+        mkdir($this->dir);
+    }
+
+    protected function tearDown(): void
+    {
+        foreach (scandir($this->dir) ?: [] as $entry) {
+            if ($entry !== '.' && $entry !== '..') {
+                unlink($this->dir . '/' . $entry);
+            }
+        }
+        rmdir($this->dir);
+    }
+
+    /**
+     * Number of paths sharing one parent: below and at LISTING_THRESHOLD (8)
+     *
+     * @return array<string, array{int}>
+     */
+    public static function siblingCountProvider(): array
+    {
+        return [
+            'below listing threshold' => [2],
+            'at listing threshold' => [8],
+        ];
+    }
+
+    #[DataProvider('siblingCountProvider')]
+    public function testPresenceDoesNotDependOnSiblingCount(int $siblings): void
+    {
+        if (PHP_OS_FAMILY === 'Windows') {
+            $this->markTestSkipped('Creating symlinks needs elevated rights on Windows');
+        }
+
+        $dangling = $this->dir . '/dangling';
+        $absent = $this->dir . '/absent';
+        symlink($this->dir . '/missing-target', $dangling);
+
+        $paths = [$dangling, $absent];
+        for ($i = count($paths); $i < $siblings; $i++) {
+            $file = $this->dir . "/file{$i}";
+            touch($file);
+            $paths[] = $file;
+        }
+
+        $result = (new PathValidatorPlugin())->validate(['paths' => $paths]);
+
+        $this->assertFalse($result->passed);
+        $this->assertSame([$absent], $result->details['invalid_paths']);
+    }
+
+    public function testAllPresentPathsPass(): void
+    {
+        $paths = [];
+        for ($i = 0; $i < 8; $i++) {
+            $file = $this->dir . "/file{$i}";
+            touch($file);
+            $paths[] = $file;
+        }
+
+        $result = (new PathValidatorPlugin())->validate(['paths' => $paths]);
+
+        $this->assertTrue($result->passed);
+    }
+}
@@ -22,7 +22,7 @@ require_once __DIR__ . '/../../vendor/autoload.php';
 use MokoEnterprise\CliFramework;
 
 /**
- * Runs `xmllint --noout` against all tracked *.xml files and reports errors.
+ * Parses all tracked *.xml files with libxml and reports errors.
  */
 class CheckXmlWellformed extends CliFramework
 {
@@ -47,22 +47,28 @@ class CheckXmlWellformed extends CliFramework
 		$files  = array_filter(explode("\n", $output));
 		$errors = 0;
 
+		// Parse in-process with the same libxml that backs xmllint, instead
+		// of forking one xmllint per file.
+		$useInternal = libxml_use_internal_errors(true);
+
 		foreach ($files as $file) {
 			$fullPath = $path . '/' . $file;
 			if (!is_file($fullPath)) {
 				continue;
 			}
-			exec('xmllint --noout ' . escapeshellarg($fullPath) . ' 2>&1', $out, $code);
-			if ($code !== 0) {
+			$doc = new DOMDocument();
+			if (!$doc->load($fullPath, LIBXML_NONET)) {
 				echo "[ERROR] XML not well-formed: {$file}\n";
-				foreach ($out as $line) {
-					echo "  {$line}\n";
+				foreach (libxml_get_errors() as $error) {
+					echo "  {$fullPath}:{$error->line}: parser error : " . trim($error->message) . "\n";
 				}
 				$errors++;
 			}
-			unset($out);
+			libxml_clear_errors();
 		}
 
+		libxml_use_internal_errors($useInternal);
+
 		if ($errors === 0) {
 			$this->log('INFO', '[OK] All XML files are well-formed');
 			return 0;